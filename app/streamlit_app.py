@@ -2,41 +2,66 @@
 
 from __future__ import annotations
 
-import json
+import re
 from pathlib import Path
 
+import orjson
 import pandas as pd
-import plotly.graph_objects as go
 import streamlit as st
 
+from posthog_impact.config import DASHBOARD_CACHE_TTL, DASHBOARD_TABLE_CACHE_ENTRIES
 from posthog_impact.scoring import parse_prs, score_engineers
+from posthog_impact.storage import iter_raw_prs
 
 PROCESSED_DIR = Path(__file__).resolve().parent.parent / "data" / "processed"
 RAW_DIR = Path(__file__).resolve().parent.parent / "data" / "raw"
 
+_BOT_PATTERNS = frozenset(
+    ("bot", "[bot]", "-app", "dependabot", "copilot-swe", "posthog-bot")
+)
+# Case-insensitive substring match: patterns containing another pattern
+# (e.g. "dependabot") can never change the result, so they are left out
+# of the alternation.
+_BOT_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in sorted(_BOT_PATTERNS)
+        if not any(q != p and q in p for q in _BOT_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
 
 # ── Data loading (cached) ──────────────────────────────────────────────────
 
-@st.cache_data
-def _load_latest_scores() -> tuple[list[dict], dict] | None:
-    """Load the most recent scores JSON file. Returns (scores, metadata)."""
-    files = sorted(PROCESSED_DIR.glob("scores_*.json"))
-    if not files:
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL)
+def _load_latest_scores() -> tuple[list[dict], list[dict] | None, dict] | None:
+    """Load the most recent scores JSON file.
+
+    Returns ``(scores, noisy_scores, metadata)``; ``noisy_scores`` (noisy
+    files included) is None for files written before both variants were
+    precomputed.
+
+    Cached as a shared resource (no hashing or copying on hit), so callers
+    must treat the returned objects as read-only.
+    """
+    latest = max(PROCESSED_DIR.glob("scores_*.json"), default=None)
+    if latest is None:
         return None
-    data = json.loads(files[-1].read_text())
-    return data.get("scores", data), data.get("_metadata", {})
+    data = orjson.loads(latest.read_bytes())
+    return data.get("scores", data), data.get("scores_noisy"), data.get("_metadata", {})
 
 
-@st.cache_data
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL)
 def _load_raw_prs(raw_file_path: str) -> list[dict] | None:
-    """Load raw PR data for live re-scoring."""
+    """Load raw PR data for live re-scoring. Read-only, like the scores."""
     path = Path(raw_file_path)
     if not path.exists():
         # Try relative to project root
         path = RAW_DIR / path.name
     if not path.exists():
         return None
-    return json.loads(path.read_text())
+    return list(iter_raw_prs(path))
 
 
 def _rescore(raw_prs: list[dict], exclude_noisy: bool) -> list[dict]:
@@ -62,6 +87,54 @@ def _rescore(raw_prs: list[dict], exclude_noisy: bool) -> list[dict]:
     ]
 
 
+# ── Display helpers ─────────────────────────────────────────────────────────
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, max_entries=DASHBOARD_TABLE_CACHE_ENTRIES)
+def _build_display_df(
+    _filtered: pd.DataFrame,
+    top_n: int,
+    min_impact: float,
+    exclude_noisy: bool,
+    computed_at: str,
+) -> pd.DataFrame:
+    """Format the leaderboard table for display.
+
+    Keyed on the filter state (plus the scores file's ``computed_at``);
+    ``_filtered`` is derived from those and is not hashed. The minimum
+    impact slider makes the key space open-ended, so entries are bounded
+    and expire.
+    """
+    display_df = _filtered[
+        [
+            "login",
+            "final_impact",
+            "total_shipping",
+            "total_reviews",
+            "core_touch_ratio",
+            "active_weeks",
+            "pr_count",
+            "review_count",
+        ]
+    ].copy()
+    display_df["core_touch_ratio"] = (
+        (display_df["core_touch_ratio"] * 100).round().astype(int).astype(str) + "%"
+    )
+    display_df["active_weeks"] = display_df["active_weeks"].astype(str) + " / 13"
+    display_df = display_df.rename(columns={
+        "login": "Engineer",
+        "final_impact": "Impact Score",
+        "total_shipping": "Shipping",
+        "total_reviews": "Reviews",
+        "core_touch_ratio": "Core Ratio",
+        "active_weeks": "Weeks Active",
+        "pr_count": "PRs Merged",
+        "review_count": "Reviews Given",
+    })
+    display_df = display_df.reset_index(drop=True)
+    display_df.index = display_df.index + 1
+    return display_df
+
+
 # ── Dashboard ───────────────────────────────────────────────────────────────
 
 def main() -> None:
@@ -81,7 +154,7 @@ def main() -> None:
         )
         return
 
-    scores_data, metadata = loaded
+    scores_data, noisy_scores_data, metadata = loaded
 
     pr_count = metadata.get("pr_count", "?")
     engineer_count = metadata.get("engineer_count", len(scores_data))
@@ -115,16 +188,21 @@ def main() -> None:
 
         exclude_noisy = st.toggle(
             "Exclude noisy files (lockfiles, snapshots, etc.)", value=True,
-            help="Toggling re-scores all engineers from raw data. "
-                 "Noisy files include lockfiles, snapshots, and generated code.",
+            help="Toggling switches to scores precomputed with noisy files "
+                 "included. Noisy files include lockfiles, snapshots, and "
+                 "generated code.",
         )
 
-        # Live re-scoring when noisy toggle changes
+        # Noisy variant is precomputed; older score files fall back to
+        # live re-scoring from the raw dump
         raw_file = metadata.get("raw_file", "")
-        if not exclude_noisy and raw_file:
-            raw_prs = _load_raw_prs(raw_file)
-            if raw_prs is not None:
-                scores_data = _rescore(raw_prs, exclude_noisy=False)
+        if not exclude_noisy:
+            if noisy_scores_data is not None:
+                scores_data = noisy_scores_data
+            elif raw_file:
+                raw_prs = _load_raw_prs(raw_file)
+                if raw_prs is not None:
+                    scores_data = _rescore(raw_prs, exclude_noisy=False)
 
     df = pd.DataFrame(scores_data)
     if df.empty:
@@ -140,84 +218,71 @@ def main() -> None:
     )
 
     # ── Filter ──────────────────────────────────────────────────────────
-    _BOT_PATTERNS = ("bot", "[bot]", "-app", "dependabot", "copilot-swe", "posthog-bot")
-    is_bot = df["login"].str.lower().apply(
-        lambda x: any(p in x for p in _BOT_PATTERNS)
-    )
+    is_bot = df["login"].str.contains(_BOT_RE, na=False)
     filtered = df[~is_bot & (df["final_impact"] >= min_impact)].head(top_n)
     if filtered.empty:
         st.warning("No engineers match the current filters.")
         return
 
     # ── Side-by-side: table (left) + chart (right) ──────────────────────
-    display_df = filtered[
-        [
-            "login",
-            "final_impact",
-            "total_shipping",
-            "total_reviews",
-            "core_touch_ratio",
-            "active_weeks",
-            "pr_count",
-            "review_count",
-        ]
-    ].copy()
-    display_df["core_touch_ratio"] = display_df["core_touch_ratio"].apply(
-        lambda x: f"{x:.0%}"
-    )
-    display_df["active_weeks"] = display_df["active_weeks"].apply(
-        lambda w: f"{w} / 13"
+    display_df = _build_display_df(
+        filtered, top_n, min_impact, exclude_noisy, computed_at
     )
-    display_df = display_df.rename(columns={
-        "login": "Engineer",
-        "final_impact": "Impact Score",
-        "total_shipping": "Shipping",
-        "total_reviews": "Reviews",
-        "core_touch_ratio": "Core Ratio",
-        "active_weeks": "Weeks Active",
-        "pr_count": "PRs Merged",
-        "review_count": "Reviews Given",
-    })
-    display_df = display_df.reset_index(drop=True)
-    display_df.index = display_df.index + 1
 
     col_table, col_chart = st.columns([3, 2])
 
     with col_table:
         st.markdown(f"**Top {len(filtered)} Engineers**")
         st.dataframe(
-            display_df.style.format({
-                "Impact Score": "{:.1f}",
-                "Shipping": "{:.1f}",
-                "Reviews": "{:.1f}",
-            }),
+            display_df,
+            column_config={
+                "Impact Score": st.column_config.NumberColumn(format="%.1f"),
+                "Shipping": st.column_config.NumberColumn(format="%.1f"),
+                "Reviews": st.column_config.NumberColumn(format="%.1f"),
+            },
+            hide_index=False,
             use_container_width=True,
             height=215,
         )
 
     with col_chart:
         st.markdown("**Shipping vs Review Contribution**")
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=filtered["login"],
-            y=filtered["total_shipping"],
-            name="Shipping",
-            marker_color="#FF6B6B",
-        ))
-        fig.add_trace(go.Bar(
-            x=filtered["login"],
-            y=filtered["total_reviews"],
-            name="Reviews",
-            marker_color="#4ECDC4",
-        ))
-        fig.update_layout(
-            barmode="stack",
-            xaxis_title="Engineer",
-            yaxis_title="Log-scaled score",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            margin=dict(t=10, b=40, l=50, r=10),
-            height=215,
-        )
+        # st.plotly_chart still builds a validated go.Figure from this
+        # dict; the gain is the layout's uirevision, which keeps zoom and
+        # legend state across reruns
+        fig = {
+            "data": [
+                {
+                    "type": "bar",
+                    "x": filtered["login"],
+                    "y": filtered["total_shipping"],
+                    "name": "Shipping",
+                    "marker": {"color": "#FF6B6B"},
+                },
+                {
+                    "type": "bar",
+                    "x": filtered["login"],
+                    "y": filtered["total_reviews"],
+                    "name": "Reviews",
+                    "marker": {"color": "#4ECDC4"},
+                },
+            ],
+            "layout": {
+                "barmode": "stack",
+                "uirevision": "shipping-vs-reviews",
+                "xaxis": {"title": {"text": "Engineer"}},
+                "yaxis": {"title": {"text": "Log-scaled score"}},
+                "legend": {
+                    "orientation": "h",
+                    "yanchor": "bottom",
+                    "y": 1.02,
+                    "xanchor": "right",
+                    "x": 1,
+                },
+                "margin": {"t": 10, "b": 40, "l": 50, "r": 10},
+                "height": 215,
+            },
+        }
         st.plotly_chart(fig, use_container_width=True)
 
     # ── Top PRs (collapsed) ──────────────────────────────────────────────
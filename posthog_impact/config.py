@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import fnmatch
 import os
+import re
 from pathlib import Path
 
 # ── Paths ───────────────────────────────────────────────────────────────────
@@ -46,17 +48,43 @@ NOISY_FILE_PATTERNS: list[str] = [
     "*.map",
     "__generated__/*",
 ]
+# Patterns split by shape so most paths are decided by set/suffix checks:
+# literal file names, ``*<literal>`` suffixes, and a residual glob regex.
+_GLOB_CHARS = frozenset("*?[")
+NOISY_BASENAMES: frozenset[str] = frozenset(
+    p for p in NOISY_FILE_PATTERNS if "/" not in p and not _GLOB_CHARS & set(p)
+)
+NOISY_SUFFIXES: tuple[str, ...] = tuple(
+    p[1:] for p in NOISY_FILE_PATTERNS
+    if p.startswith("*") and not _GLOB_CHARS & set(p[1:])
+)
+NOISY_GLOB_RE: re.Pattern[str] = re.compile(
+    "|".join(
+        fnmatch.translate(p) for p in NOISY_FILE_PATTERNS
+        if p not in NOISY_BASENAMES and p[1:] not in NOISY_SUFFIXES
+    )
+    or "(?!)"  # no residual globs: never match
+)
+
+# ── Parsing ────────────────────────────────────────────────────────────────
+PARSE_PARALLEL_MIN_PRS: int = 2000  # below this, worker startup outweighs the gain
+PARSE_CHUNK_SIZE: int = 500  # raw PRs per worker task
 
 # ── Fetch settings ─────────────────────────────────────────────────────────
 SEARCH_WINDOW_DAYS: int = 7
 SEARCH_PER_PAGE: int = 100
+SEARCH_ETAG_CACHE: Path = DATA_DIR / ".search_etags.json"
 REVIEW_PAGE_SIZE: int = 100
+PR_BATCH_SIZE: int = 25  # PRs per aliased GraphQL details query
 FILE_PAGE_SIZE: int = 100
 RATE_LIMIT_BUFFER: int = 5
+FETCH_CONCURRENCY: int = 8  # max in-flight requests for the async client
 RETRY_MAX: int = 3
 RETRY_BACKOFF: float = 2.0  # seconds, exponential base
 
 # ── Dashboard defaults ─────────────────────────────────────────────────────
 DEFAULT_LOOKBACK_DAYS: int = 90
 DEFAULT_TOP_N: int = 5
+DASHBOARD_CACHE_TTL: int = 3600  # seconds
+DASHBOARD_TABLE_CACHE_ENTRIES: int = 64  # cached leaderboard tables
 CONSISTENCY_WEEKS: int = 12
@@ -1,55 +1,65 @@
-"""Three-phase data fetcher: Search → PR details → file changes."""
+"""Three-phase data fetcher: Search → PR details → file changes.
+
+All phases run on ``AsyncGitHubClient``.  Phases 1 and 2 are pipelined
+per batch of PRs and streamed to a JSONL file, so memory stays bounded
+regardless of window size.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
 
 from posthog_impact.config import (
     DEFAULT_ORG,
     DEFAULT_REPO,
+    FETCH_CONCURRENCY,
     FILE_PAGE_SIZE,
+    PR_BATCH_SIZE,
     REVIEW_PAGE_SIZE,
+    SEARCH_ETAG_CACHE,
     SEARCH_PER_PAGE,
     SEARCH_WINDOW_DAYS,
 )
-from posthog_impact.github_client import GitHubClient
+from posthog_impact.github_client import NOT_MODIFIED, AsyncGitHubClient
 
 logger = logging.getLogger(__name__)
 
 # ── GraphQL Queries ─────────────────────────────────────────────────────────
 
-QUERY_PR_DETAILS = """
-query($owner: String!, $name: String!, $number: Int!) {
-  repository(owner: $owner, name: $name) {
-    pullRequest(number: $number) {
-      id
-      number
-      title
-      url
+_PR_FIELDS_FRAGMENT = """
+fragment PRFields on PullRequest {
+  id
+  number
+  title
+  url
+  author { login }
+  mergedAt
+  createdAt
+  changedFiles
+  additions
+  deletions
+  comments { totalCount }
+  reviewThreads { totalCount }
+  reviews(first: %d) {
+    nodes {
       author { login }
-      mergedAt
-      createdAt
-      changedFiles
-      additions
-      deletions
+      state
+      submittedAt
       comments { totalCount }
-      reviewThreads { totalCount }
-      reviews(first: %d) {
-        nodes {
-          author { login }
-          state
-          submittedAt
-          comments { totalCount }
-        }
-      }
     }
   }
-  rateLimit { cost remaining resetAt }
 }
-""" % REVIEW_PAGE_SIZE
+"""
 
-QUERY_FILES = """
+_QUERY_FILES = """
 query($nodeId: ID!, $cursor: String) {
   node(id: $nodeId) {
     ... on PullRequest {
@@ -65,35 +75,117 @@ query($nodeId: ID!, $cursor: String) {
   }
   rateLimit { cost remaining resetAt }
 }
-""" % FILE_PAGE_SIZE
+"""
+
+
+@lru_cache(maxsize=16)
+def batched_pr_details_query(
+    batch_size: int,
+    review_page_size: int = REVIEW_PAGE_SIZE,
+) -> str:
+    """Build a query selecting *batch_size* PRs as aliases ``pr0..prN``.
+
+    PR numbers are passed as variables ``$n0..$nN`` so the query text only
+    depends on the batch size.
+    """
+    params = "".join(f", $n{i}: Int!" for i in range(batch_size))
+    selections = "\n".join(
+        f"    pr{i}: pullRequest(number: $n{i}) {{ ...PRFields }}"
+        for i in range(batch_size)
+    )
+    return (
+        f"\nquery($owner: String!, $name: String!{params}) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n"
+        f"{selections}\n"
+        f"  }}\n"
+        f"  rateLimit {{ cost remaining resetAt }}\n"
+        f"}}\n"
+    ) + _PR_FIELDS_FRAGMENT % review_page_size
+
+
+@lru_cache(maxsize=16)
+def files_query(file_page_size: int = FILE_PAGE_SIZE) -> str:
+    """Query for one page of *file_page_size* changed files of a PR node."""
+    return _QUERY_FILES % file_page_size
 
 
 # ── Phase 0: Search (REST) ─────────────────────────────────────────────────
 
-def search_merged_pr_numbers(
-    client: GitHubClient,
+# A Monday: window boundaries are multiples of ``window_days`` from here, so
+# 7-day windows are exactly ISO weeks.
+_WINDOW_EPOCH = date(1970, 1, 5)
+
+
+def search_windows(
+    since: date,
+    until: date,
+    window_days: int = SEARCH_WINDOW_DAYS,
+) -> list[tuple[date, date]]:
+    """Split *since*..*until* into inclusive ``(start, end)`` date windows.
+
+    Boundaries sit on fixed calendar positions rather than on *since*, so
+    interior windows (and their cached search ETags) are identical from
+    one run to the next; only the first and last windows are partial.
+    """
+    windows: list[tuple[date, date]] = []
+    start = since
+    while start <= until:
+        offset = (start - _WINDOW_EPOCH).days % window_days
+        end = min(start + timedelta(days=window_days - offset - 1), until)
+        windows.append((start, end))
+        start = end + timedelta(days=1)
+    return windows
+
+
+def _search_query(owner: str, name: str, since: date, until: date) -> str:
+    return (
+        f"repo:{owner}/{name} is:pr is:merged "
+        f"merged:{since:%Y-%m-%d}..{until:%Y-%m-%d}"
+    )
+
+
+async def search_merged_pr_numbers(
+    client: AsyncGitHubClient,
     owner: str,
     name: str,
-    since: datetime,
-    until: datetime,
+    since: date,
+    until: date,
+    etag_cache: dict[str, dict] | None = None,
 ) -> list[int]:
-    """Search for merged PR numbers in a single date window.
+    """Search for merged PR numbers in a single (inclusive) date window.
 
     Uses the GitHub Search REST API with ``merged:`` date filter.
     Paginates through all results (100 per page, max 1000 per query).
+
+    If *etag_cache* holds an entry for this query, the first page is a
+    conditional request; a 304 means the window is unchanged and the
+    cached numbers are returned without paginating.
     """
     since_str = since.strftime("%Y-%m-%d")
     until_str = until.strftime("%Y-%m-%d")
-    q = f"repo:{owner}/{name} is:pr is:merged merged:{since_str}..{until_str}"
+    q = _search_query(owner, name, since, until)
 
+    cached = (etag_cache or {}).get(q) or {}
+    cached_numbers = cached.get("numbers")
+    # A partial entry has nothing to fall back on: treat it as a miss
+    cached_etag = cached.get("etag") if cached_numbers is not None else None
     numbers: list[int] = []
     page = 1
+    etag: str | None = None
 
     while True:
-        data = client.rest_get(
-            "/search/issues",
-            params={"q": q, "per_page": SEARCH_PER_PAGE, "page": page},
-        )
+        params = {"q": q, "per_page": SEARCH_PER_PAGE, "page": page}
+        if page == 1:
+            data, etag = await client.rest_get_conditional(
+                "/search/issues",
+                params=params,
+                etag=cached_etag,
+            )
+            if data is NOT_MODIFIED:
+                logger.info("  Window %s..%s unchanged (304)", since_str, until_str)
+                return list(cached_numbers)
+        else:
+            data = await client.rest_get("/search/issues", params=params)
         items = data.get("items", [])
         if not items:
             break
@@ -117,28 +209,42 @@ def search_merged_pr_numbers(
             break
         page += 1
 
+    if etag_cache is not None and etag:
+        etag_cache[q] = {"etag": etag, "numbers": numbers}
     return numbers
 
 
-def search_all_windows(
-    client: GitHubClient,
+def _load_etag_cache(path: Path) -> dict[str, dict]:
+    """Read the search ETag cache, or return an empty one."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+async def search_all_windows(
+    client: AsyncGitHubClient,
     owner: str,
     name: str,
     since: datetime,
     window_days: int = SEARCH_WINDOW_DAYS,
+    etag_cache_path: Path | None = SEARCH_ETAG_CACHE,
 ) -> list[int]:
     """Split the date range into windows and collect all merged PR numbers.
 
+    Windows follow ``search_windows``.  Per-window ETags are persisted at
+    *etag_cache_path* (``None`` disables caching) so unchanged historical
+    windows cost a single 304; entries for windows outside the current
+    range are pruned on save.
+
     Returns a deduplicated, sorted list of PR numbers.
     """
-    now = datetime.now(timezone.utc)
+    today = datetime.now(timezone.utc).date()
+    windows = search_windows(since.date(), today, window_days)
     all_numbers: set[int] = set()
+    etag_cache = _load_etag_cache(etag_cache_path) if etag_cache_path else None
 
-    window_start = since
-    window_idx = 0
-    while window_start < now:
-        window_end = min(window_start + timedelta(days=window_days), now)
-        window_idx += 1
+    for window_idx, (window_start, window_end) in enumerate(windows, 1):
         logger.info(
             "Search window %d: %s → %s",
             window_idx,
@@ -146,64 +252,59 @@ def search_all_windows(
             window_end.strftime("%Y-%m-%d"),
         )
 
-        numbers = search_merged_pr_numbers(client, owner, name, window_start, window_end)
+        numbers = await search_merged_pr_numbers(
+            client, owner, name, window_start, window_end, etag_cache
+        )
         all_numbers.update(numbers)
         logger.info("  Found %d PRs (total unique so far: %d)", len(numbers), len(all_numbers))
 
-        window_start = window_end
+    if etag_cache_path and etag_cache is not None:
+        current = {_search_query(owner, name, start, end) for start, end in windows}
+        etag_cache = {q: entry for q, entry in etag_cache.items() if q in current}
+        etag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        etag_cache_path.write_bytes(orjson.dumps(etag_cache, option=orjson.OPT_INDENT_2))
 
     return sorted(all_numbers)
 
 
 # ── Phase 1: PR Details (GraphQL) ──────────────────────────────────────────
 
-def fetch_pr_details(
-    client: GitHubClient,
-    owner: str,
-    name: str,
-    number: int,
-) -> dict | None:
-    """Fetch full metadata and reviews for a single PR by number."""
-    data = client.graphql(
-        QUERY_PR_DETAILS,
-        variables={"owner": owner, "name": name, "number": number},
-    )
-    pr_data = data.get("repository", {}).get("pullRequest")
-    if pr_data is None:
-        logger.warning("PR #%d not found or inaccessible.", number)
-    return pr_data
-
-
-def fetch_all_pr_details(
-    client: GitHubClient,
+async def fetch_pr_details_batch(
+    client: AsyncGitHubClient,
     owner: str,
     name: str,
     numbers: list[int],
 ) -> list[dict]:
-    """Fetch details for all PR numbers. Logs progress."""
-    results: list[dict] = []
-    total = len(numbers)
+    """Fetch metadata and reviews for several PRs in one aliased query."""
+    variables: dict[str, object] = {"owner": owner, "name": name}
+    for i, number in enumerate(numbers):
+        variables[f"n{i}"] = number
 
-    for i, number in enumerate(numbers, 1):
-        if i % 50 == 1 or i == total:
-            logger.info("Fetching PR details: %d/%d", i, total)
-        pr = fetch_pr_details(client, owner, name, number)
-        if pr is not None:
-            results.append(pr)
+    data = await client.graphql(
+        batched_pr_details_query(len(numbers)), variables=variables
+    )
+    repo = data.get("repository") or {}
 
+    results: list[dict] = []
+    for i, number in enumerate(numbers):
+        pr_data = repo.get(f"pr{i}")
+        if pr_data is None:
+            logger.warning("PR #%d not found or inaccessible.", number)
+            continue
+        results.append(pr_data)
     return results
 
 
 # ── Phase 2: Files (GraphQL) ───────────────────────────────────────────────
 
-def fetch_files_for_pr(client: GitHubClient, node_id: str) -> list[dict]:
+async def fetch_files_for_pr(client: AsyncGitHubClient, node_id: str) -> list[dict]:
     """Fetch all changed files for a PR using its node ID."""
     all_files: list[dict] = []
     cursor: str | None = None
 
     while True:
-        data = client.graphql(
-            QUERY_FILES,
+        data = await client.graphql(
+            files_query(),
             variables={"nodeId": node_id, "cursor": cursor},
         )
         file_conn = data["node"]["files"]
@@ -216,44 +317,100 @@ def fetch_files_for_pr(client: GitHubClient, node_id: str) -> list[dict]:
     return all_files
 
 
+async def fetch_all_files(client: AsyncGitHubClient, prs: list[dict]) -> None:
+    """Attach ``_files`` to every PR dict, fetching PRs concurrently."""
+
+    async def run(pr: dict) -> None:
+        pr["_files"] = await fetch_files_for_pr(client, pr["id"])
+
+    await asyncio.gather(*(run(pr) for pr in prs))
+
+
+# ── Phases 1+2 pipelined ────────────────────────────────────────────────────
+
+async def iter_prs_with_files(
+    client: AsyncGitHubClient,
+    owner: str,
+    name: str,
+    numbers: list[int],
+    batch_size: int = PR_BATCH_SIZE,
+    max_batches: int = FETCH_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """Yield PR dicts with ``_files`` attached, batch by batch.
+
+    Each batch runs Phase 1 (one aliased details query) then Phase 2 (files
+    for its PRs).  At most *max_batches* batches are scheduled at a time;
+    a new one starts only when the oldest is consumed, so memory stays
+    bounded regardless of how many PRs are fetched.  PRs are yielded in
+    *numbers* order, keeping the raw dump stable between runs.
+    """
+    batches = (numbers[i:i + batch_size] for i in range(0, len(numbers), batch_size))
+    pending: deque[asyncio.Task[list[dict]]] = deque()
+
+    async def run(batch: list[int]) -> list[dict]:
+        prs = await fetch_pr_details_batch(client, owner, name, batch)
+        await fetch_all_files(client, prs)
+        return prs
+
+    def schedule_next() -> None:
+        batch = next(batches, None)
+        if batch is not None:
+            pending.append(asyncio.ensure_future(run(batch)))
+
+    for _ in range(max_batches):
+        schedule_next()
+    try:
+        while pending:
+            prs = await pending.popleft()
+            schedule_next()
+            for pr in prs:
+                yield pr
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 # ── Orchestrator ────────────────────────────────────────────────────────────
 
-def fetch_all(
+async def fetch_all_async(
+    out_path: Path,
     owner: str = DEFAULT_ORG,
     name: str = DEFAULT_REPO,
     since: datetime | None = None,
     lookback_days: int = 90,
-) -> list[dict]:
-    """Run the full three-phase fetch pipeline.
+) -> int:
+    """Run the full three-phase fetch pipeline, streaming PRs to *out_path*.
 
-    1. Search REST API → merged PR numbers (7-day windows)
-    2. GraphQL → PR details + reviews
+    1. Search REST API → merged PR numbers (7-day windows, ETag-cached)
+    2. GraphQL → PR details + reviews (batched, aliased queries)
     3. GraphQL → file changes per PR
 
-    Returns a list of PR dicts with ``_files`` key attached.
+    Each PR dict (with ``_files`` attached) is written as one JSONL line as
+    soon as its batch is consumed.  The file is written under a ``.partial``
+    name and renamed on success.  Returns the number of PRs written.
     """
     if since is None:
         since = datetime.now(timezone.utc) - timedelta(days=lookback_days)
 
-    with GitHubClient() as client:
+    async with AsyncGitHubClient() as client:
         # Phase 0
         logger.info("Phase 0: Searching for merged PRs since %s", since.strftime("%Y-%m-%d"))
-        pr_numbers = search_all_windows(client, owner, name, since)
+        pr_numbers = await search_all_windows(client, owner, name, since)
         logger.info("Phase 0 complete: %d unique PR numbers found.", len(pr_numbers))
 
-        # Phase 1
-        logger.info("Phase 1: Fetching PR details via GraphQL...")
-        prs = fetch_all_pr_details(client, owner, name, pr_numbers)
-        logger.info("Phase 1 complete: %d PRs fetched.", len(prs))
-
-        # Phase 2
-        logger.info("Phase 2: Fetching files for each PR...")
-        for i, pr in enumerate(prs, 1):
-            node_id = pr["id"]
-            if i % 50 == 1 or i == len(prs):
-                logger.info("Fetching files: %d/%d", i, len(prs))
-            pr["_files"] = fetch_files_for_pr(client, node_id)
-
-        logger.info("Phase 2 complete. All data fetched.")
-
-    return prs
+        # Phases 1+2
+        logger.info("Phases 1+2: Fetching PR details and files via GraphQL...")
+        partial_path = out_path.with_name(out_path.name + ".partial")
+        count = 0
+        with partial_path.open("wb") as fh:
+            async for pr in iter_prs_with_files(client, owner, name, pr_numbers):
+                fh.write(orjson.dumps(pr, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+                if count % 50 == 1 or count == len(pr_numbers):
+                    logger.info("Fetched PRs with files: %d/%d", count, len(pr_numbers))
+        partial_path.replace(out_path)
+
+        logger.info("Phases 1+2 complete: %d PRs written.", count)
+
+    return count
@@ -1,15 +1,23 @@
-"""GitHub API client supporting both REST and GraphQL with rate-limit handling."""
+"""GitHub API clients supporting both REST and GraphQL with rate-limit handling.
+
+``GitHubClient`` is blocking; ``AsyncGitHubClient`` exposes the same
+methods as coroutines for concurrent fetching.  Both share token handling
+and rate-limit bookkeeping via ``_GitHubClientBase``.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from posthog_impact.config import (
+    FETCH_CONCURRENCY,
     GITHUB_API_BASE,
     GITHUB_TOKEN,
     GRAPHQL_URL,
@@ -21,9 +29,16 @@ from posthog_impact.config import (
 
 logger = logging.getLogger(__name__)
 
+GRAPHQL_RATE_LIMIT_SLEEP: int = 60  # seconds
+
+_JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
+# Returned by ``rest_get_conditional`` when the server answers 304.
+NOT_MODIFIED: Any = object()
 
-class GitHubClient:
-    """Unified GitHub client for REST and GraphQL with automatic retries."""
+
+class _GitHubClientBase:
+    """Token handling and rate-limit state shared by both clients."""
 
     def __init__(self, token: str | None = None) -> None:
         self._token = token or GITHUB_TOKEN
@@ -31,68 +46,185 @@ class GitHubClient:
             raise ValueError(
                 "GITHUB_TOKEN is required. Set it as an environment variable."
             )
-        self._client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {self._token}",
-                "Accept": "application/vnd.github+json",
-            },
-            timeout=REQUEST_TIMEOUT,
-        )
         self._remaining: int = 5000
         self._reset_at: float = 0.0
+        # resetAt changes at most hourly; remember the last (raw, parsed) pair
+        self._last_reset: tuple[str, float] = ("", 0.0)
 
-    # ── GraphQL ─────────────────────────────────────────────────────────
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/vnd.github+json",
+        }
 
-    def graphql(
-        self,
-        query: str,
-        variables: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        """Execute a GraphQL query. Must include ``rateLimit`` selection.
+    # ── Rate-limit helpers ──────────────────────────────────────────────
 
-        Returns the ``data`` dict from the response.
+    def _rate_limit_wait(self) -> float:
+        """Seconds to sleep if remaining API points are below the safety buffer."""
+        if self._remaining >= RATE_LIMIT_BUFFER:
+            return 0.0
+        wait = max(0, self._reset_at - time.time()) + 5
+        logger.info(
+            "Rate limit low (%d remaining). Sleeping %.0fs.",
+            self._remaining,
+            wait,
+        )
+        return wait
+
+    def _retry_wait(self, resp: httpx.Response, attempt: int) -> float | None:
+        """Seconds to sleep before retrying *resp*, or None if it is final.
+
+        Retries HTTP 403/429 (honouring ``Retry-After``) and GraphQL bodies
+        that report a rate-limit error.
         """
-        payload: dict[str, Any] = {"query": query}
-        if variables:
-            payload["variables"] = variables
+        if resp.status_code in (403, 429):
+            retry_after = int(resp.headers.get("Retry-After", "60"))
+            logger.warning(
+                "Rate limited (HTTP %d). Sleeping %ds (attempt %d/%d).",
+                resp.status_code,
+                retry_after,
+                attempt,
+                RETRY_MAX,
+            )
+            return retry_after
+
+        # Cheap byte scan first so successful GraphQL bodies are parsed once
+        if resp.url == GRAPHQL_URL and b'"errors"' in resp.content:
+            error_msg = _graphql_error_message(orjson.loads(resp.content))
+            if "rate limit" in error_msg.lower():
+                logger.warning(
+                    "GraphQL rate-limit error, sleeping %ds (attempt %d/%d).",
+                    GRAPHQL_RATE_LIMIT_SLEEP,
+                    attempt,
+                    RETRY_MAX,
+                )
+                return GRAPHQL_RATE_LIMIT_SLEEP
 
-        for attempt in range(1, RETRY_MAX + 1):
-            self._wait_if_rate_limited()
+        return None
 
+    def _transport_retry_wait(self, exc: httpx.TransportError, attempt: int) -> float:
+        """Backoff before retrying after *exc*; raise once retries are exhausted.
+
+        Covers failures the transport's connect retries do not, e.g. read
+        timeouts or a connection dropped mid-response.
+        """
+        logger.warning("Transport error (attempt %d/%d): %s", attempt, RETRY_MAX, exc)
+        if attempt == RETRY_MAX:
+            raise RuntimeError(f"All {RETRY_MAX} retries exhausted") from exc
+        return RETRY_BACKOFF ** attempt
+
+    def _track_rest_headers(self, resp: httpx.Response) -> None:
+        """Update rate-limit state from ``X-RateLimit-*`` headers."""
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset_ts = resp.headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            self._remaining = int(remaining)
+        if reset_ts is not None:
+            self._reset_at = float(reset_ts)
+
+    def _graphql_data(self, resp: httpx.Response) -> dict[str, Any]:
+        """Return ``data`` from a GraphQL response; raise on GraphQL errors."""
+        resp.raise_for_status()
+        body = orjson.loads(resp.content)
+
+        # Track rate limit from GraphQL response body
+        rate_info = (body.get("data") or {}).get("rateLimit")
+        if rate_info:
+            self._update_rate_limit(rate_info)
+
+        if "errors" in body:
+            raise RuntimeError(f"GraphQL errors: {_graphql_error_message(body)}")
+        return body["data"]
+
+    def _update_rate_limit(self, rate_info: dict[str, Any]) -> None:
+        """Update internal rate-limit state from a GraphQL rateLimit field."""
+        self._remaining = rate_info.get("remaining", self._remaining)
+        reset_at_str = rate_info.get("resetAt")
+        if reset_at_str:
+            if reset_at_str != self._last_reset[0]:
+                self._last_reset = (
+                    reset_at_str,
+                    datetime.fromisoformat(reset_at_str).timestamp(),
+                )
+            # Always reassign: REST headers may have moved _reset_at since
+            self._reset_at = self._last_reset[1]
+        logger.debug(
+            "Rate limit: cost=%s remaining=%s",
+            rate_info.get("cost"),
+            self._remaining,
+        )
+
+
+def _graphql_error_message(body: dict[str, Any]) -> str:
+    """Join the messages of a GraphQL ``errors`` list."""
+    return "; ".join(e.get("message", str(e)) for e in body.get("errors") or [])
+
+
+def _graphql_payload(query: str, variables: dict[str, Any] | None) -> bytes:
+    """Encode a GraphQL request body once with orjson."""
+    payload: dict[str, Any] = {"query": query}
+    if variables:
+        payload["variables"] = variables
+    return orjson.dumps(payload)
+
+
+class GitHubClient(_GitHubClientBase):
+    """Unified GitHub client for REST and GraphQL with automatic retries.
+
+    Connection setup is retried by the httpx transport; other transport
+    errors and rate limits are retried with backoff in ``_request``.
+    *transport* overrides the default transport (e.g. an
+    ``httpx.MockTransport`` in tests).
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        super().__init__(token)
+        self._client = httpx.Client(
+            transport=transport or httpx.HTTPTransport(retries=RETRY_MAX),
+            headers=self._headers(),
+            timeout=REQUEST_TIMEOUT,
+        )
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transport errors and rate limits."""
+        for attempt in range(1, RETRY_MAX + 1):
+            time.sleep(self._rate_limit_wait())
             try:
-                resp = self._client.post(GRAPHQL_URL, json=payload)
+                resp = self._client.request(method, url, **kwargs)
             except httpx.TransportError as exc:
-                logger.warning("Transport error (attempt %d/%d): %s", attempt, RETRY_MAX, exc)
-                if attempt == RETRY_MAX:
-                    raise RuntimeError(f"All {RETRY_MAX} retries exhausted") from exc
-                time.sleep(RETRY_BACKOFF ** attempt)
-                continue
-
-            if resp.status_code in (403, 429):
-                self._handle_rate_limit_response(resp, attempt)
+                time.sleep(self._transport_retry_wait(exc, attempt))
                 continue
 
-            resp.raise_for_status()
-            body = resp.json()
+            self._track_rest_headers(resp)
+            wait = self._retry_wait(resp, attempt)
+            if wait is None:
+                return resp
+            time.sleep(wait)
 
-            # Track rate limit from GraphQL response body
-            rate_info = body.get("data", {}).get("rateLimit")
-            if rate_info:
-                self._update_rate_limit(rate_info)
+        raise RuntimeError(f"All {RETRY_MAX} retries exhausted")
 
-            if "errors" in body:
-                error_msg = "; ".join(
-                    e.get("message", str(e)) for e in body["errors"]
-                )
-                if "rate limit" in error_msg.lower():
-                    logger.warning("GraphQL rate-limit error, sleeping 60s")
-                    time.sleep(60)
-                    continue
-                raise RuntimeError(f"GraphQL errors: {error_msg}")
+    # ── GraphQL ─────────────────────────────────────────────────────────
 
-            return body["data"]
+    def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query. Must include ``rateLimit`` selection.
 
-        raise RuntimeError(f"All {RETRY_MAX} retries exhausted")
+        Returns the ``data`` dict from the response.
+        """
+        resp = self._request(
+            "POST",
+            GRAPHQL_URL,
+            content=_graphql_payload(query, variables),
+            headers=_JSON_HEADERS,
+        )
+        return self._graphql_data(resp)
 
     # ── REST ────────────────────────────────────────────────────────────
 
@@ -105,87 +237,149 @@ class GitHubClient:
 
         Returns parsed JSON. Handles rate-limit headers and retries.
         """
-        url = f"{GITHUB_API_BASE}{endpoint}"
+        resp = self._request("GET", f"{GITHUB_API_BASE}{endpoint}", params=params)
+        resp.raise_for_status()
+        return resp.json()
 
-        for attempt in range(1, RETRY_MAX + 1):
-            self._wait_if_rate_limited()
+    def rest_get_conditional(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> tuple[Any, str | None]:
+        """Like ``rest_get`` but sends ``If-None-Match`` when *etag* is given.
 
-            try:
-                resp = self._client.get(url, params=params)
-            except httpx.TransportError as exc:
-                logger.warning("Transport error (attempt %d/%d): %s", attempt, RETRY_MAX, exc)
-                if attempt == RETRY_MAX:
-                    raise RuntimeError(f"All {RETRY_MAX} retries exhausted") from exc
-                time.sleep(RETRY_BACKOFF ** attempt)
-                continue
+        Returns ``(data, etag)``; *data* is ``NOT_MODIFIED`` on a 304, which
+        GitHub does not charge against the rate limit.
+        """
+        resp = self._request(
+            "GET",
+            f"{GITHUB_API_BASE}{endpoint}",
+            params=params,
+            headers={"If-None-Match": etag} if etag else None,
+        )
+        if resp.status_code == 304:
+            return NOT_MODIFIED, etag
+        resp.raise_for_status()
+        return resp.json(), resp.headers.get("ETag")
+
+    # ── Context manager ─────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._client.close()
+
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
-            # Track rate limit from REST headers
-            remaining = resp.headers.get("X-RateLimit-Remaining")
-            reset_ts = resp.headers.get("X-RateLimit-Reset")
-            if remaining is not None:
-                self._remaining = int(remaining)
-            if reset_ts is not None:
-                self._reset_at = float(reset_ts)
 
-            if resp.status_code in (403, 429):
-                self._handle_rate_limit_response(resp, attempt)
+class AsyncGitHubClient(_GitHubClientBase):
+    """Async counterpart of ``GitHubClient``.
+
+    At most *max_concurrency* requests are in flight at once, which keeps
+    concurrent callers within GitHub's secondary rate limits.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        max_concurrency: int = FETCH_CONCURRENCY,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        super().__init__(token)
+        self._client = httpx.AsyncClient(
+            transport=transport or httpx.AsyncHTTPTransport(retries=RETRY_MAX),
+            headers=self._headers(),
+            timeout=REQUEST_TIMEOUT,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transport errors and rate limits."""
+        for attempt in range(1, RETRY_MAX + 1):
+            await asyncio.sleep(self._rate_limit_wait())
+            try:
+                async with self._semaphore:
+                    resp = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as exc:
+                await asyncio.sleep(self._transport_retry_wait(exc, attempt))
                 continue
 
-            resp.raise_for_status()
-            return resp.json()
+            self._track_rest_headers(resp)
+            wait = self._retry_wait(resp, attempt)
+            if wait is None:
+                return resp
+            await asyncio.sleep(wait)
 
         raise RuntimeError(f"All {RETRY_MAX} retries exhausted")
 
-    # ── Rate-limit helpers ──────────────────────────────────────────────
+    # ── GraphQL ─────────────────────────────────────────────────────────
 
-    def _wait_if_rate_limited(self) -> None:
-        """Sleep if remaining API points are below the safety buffer."""
-        if self._remaining < RATE_LIMIT_BUFFER:
-            now = time.time()
-            wait = max(0, self._reset_at - now) + 5
-            if wait > 0:
-                logger.info(
-                    "Rate limit low (%d remaining). Sleeping %.0fs.",
-                    self._remaining,
-                    wait,
-                )
-                time.sleep(wait)
-
-    def _handle_rate_limit_response(self, resp: httpx.Response, attempt: int) -> None:
-        """Handle an HTTP 403/429 rate-limit response."""
-        retry_after = int(resp.headers.get("Retry-After", "60"))
-        logger.warning(
-            "Rate limited (HTTP %d). Sleeping %ds (attempt %d/%d).",
-            resp.status_code,
-            retry_after,
-            attempt,
-            RETRY_MAX,
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query. Must include ``rateLimit`` selection.
+
+        Returns the ``data`` dict from the response.
+        """
+        resp = await self._request(
+            "POST",
+            GRAPHQL_URL,
+            content=_graphql_payload(query, variables),
+            headers=_JSON_HEADERS,
         )
-        time.sleep(retry_after)
+        return self._graphql_data(resp)
 
-    def _update_rate_limit(self, rate_info: dict[str, Any]) -> None:
-        """Update internal rate-limit state from a GraphQL rateLimit field."""
-        self._remaining = rate_info.get("remaining", self._remaining)
-        reset_at_str = rate_info.get("resetAt")
-        if reset_at_str:
-            reset_dt = datetime.fromisoformat(
-                reset_at_str.replace("Z", "+00:00")
-            )
-            self._reset_at = reset_dt.timestamp()
-        logger.debug(
-            "Rate limit: cost=%s remaining=%s",
-            rate_info.get("cost"),
-            self._remaining,
+    # ── REST ────────────────────────────────────────────────────────────
+
+    async def rest_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a GET request to the GitHub REST API.
+
+        Returns parsed JSON. Handles rate-limit headers and retries.
+        """
+        resp = await self._request("GET", f"{GITHUB_API_BASE}{endpoint}", params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def rest_get_conditional(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> tuple[Any, str | None]:
+        """Like ``rest_get`` but sends ``If-None-Match`` when *etag* is given.
+
+        Returns ``(data, etag)``; *data* is ``NOT_MODIFIED`` on a 304, which
+        GitHub does not charge against the rate limit.
+        """
+        resp = await self._request(
+            "GET",
+            f"{GITHUB_API_BASE}{endpoint}",
+            params=params,
+            headers={"If-None-Match": etag} if etag else None,
         )
+        if resp.status_code == 304:
+            return NOT_MODIFIED, etag
+        resp.raise_for_status()
+        return resp.json(), resp.headers.get("ETag")
 
     # ── Context manager ─────────────────────────────────────────────────
 
-    def close(self) -> None:
+    async def aclose(self) -> None:
         """Close the underlying HTTP client."""
-        self._client.close()
+        await self._client.aclose()
 
-    def __enter__(self) -> GitHubClient:
+    async def __aenter__(self) -> AsyncGitHubClient:
         return self
 
-    def __exit__(self, *args: Any) -> None:
-        self.close()
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -6,27 +6,31 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+def _iso_week(ts: datetime) -> tuple[str, int]:
+    """``(ts.strftime("%G-%V"), YYYYWW)`` from one ``isocalendar()`` call."""
+    year, week, _ = ts.isocalendar()
+    return f"{year}-{week:02d}", year * 100 + week
+
+
+@dataclass(slots=True)
 class FileChange:
     """A single file touched in a pull request."""
 
     path: str
     additions: int
     deletions: int
+    # Top-level directory, or ``'.'`` for root-level files (set in __post_init__)
+    directory: str = field(init=False, repr=False, compare=False)
+    # Total lines changed, additions + deletions (set in __post_init__)
+    churn: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def churn(self) -> int:
-        """Total lines changed (additions + deletions)."""
-        return self.additions + self.deletions
-
-    @property
-    def directory(self) -> str:
-        """Top-level directory, or ``'.'`` for root-level files."""
-        parts = self.path.split("/")
-        return parts[0] if len(parts) > 1 else "."
+    def __post_init__(self) -> None:
+        head, sep, _ = self.path.partition("/")
+        self.directory = head if sep else "."
+        self.churn = self.additions + self.deletions
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """A review left by an engineer on a pull request."""
 
@@ -34,9 +38,16 @@ class Review:
     state: str  # APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED
     submitted_at: datetime
     comment_count: int = 0
+    # ISO week of ``submitted_at`` as ``YYYY-WW`` and as the integer
+    # ``YYYYWW`` (set in __post_init__)
+    iso_week: str = field(init=False, repr=False, compare=False)
+    week_key: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.iso_week, self.week_key = _iso_week(self.submitted_at)
 
-@dataclass
+
+@dataclass(slots=True)
 class PullRequest:
     """A merged pull request with its reviews and file changes."""
 
@@ -54,6 +65,13 @@ class PullRequest:
     review_threads_total: int
     reviews: list[Review] = field(default_factory=list)
     files: list[FileChange] = field(default_factory=list)
+    # ISO week of ``merged_at`` as ``YYYY-WW`` and as the integer
+    # ``YYYYWW`` (set in __post_init__)
+    iso_week: str = field(init=False, repr=False, compare=False)
+    week_key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.iso_week, self.week_key = _iso_week(self.merged_at)
 
     @property
     def total_churn(self) -> int:
@@ -63,7 +81,7 @@ class PullRequest:
         return self.additions + self.deletions
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineerScore:
     """Computed impact score for one engineer."""
 
@@ -18,12 +18,25 @@ Key invariants:
 
 from __future__ import annotations
 
-import fnmatch
+import heapq
+import itertools
 import logging
 import math
-from collections import defaultdict
+import os
+import sys
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
+try:  # optional: JIT-compiles the directory-churn kernel
+    import numba
+except ImportError:
+    numba = None
+
 from posthog_impact.config import (
     COMPLEXITY_CHURN_COEFF,
     CONSISTENCY_BOOST,
@@ -32,7 +45,11 @@ from posthog_impact.config import (
     CORE_MULTIPLIER_BOOST,
     DISCUSSION_COEFF,
     MIN_WEIGHTED_TOUCHES,
-    NOISY_FILE_PATTERNS,
+    NOISY_BASENAMES,
+    NOISY_GLOB_RE,
+    NOISY_SUFFIXES,
+    PARSE_CHUNK_SIZE,
+    PARSE_PARALLEL_MIN_PRS,
     REVIEW_COMMENT_COEFF,
     REVIEW_WEIGHT,
     SHIPPING_WEIGHT,
@@ -41,16 +58,19 @@ from posthog_impact.models import EngineerScore, FileChange, PullRequest, Review
 
 logger = logging.getLogger(__name__)
 
+_NUMBA_AVAILABLE = numba is not None
+
 
 # ── Noisy-file filtering ───────────────────────────────────────────────────
 
 def _is_noisy(path: str) -> bool:
-    """Return True if *path* matches any noisy file pattern."""
-    basename = path.split("/")[-1]
-    for pattern in NOISY_FILE_PATTERNS:
-        if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(basename, pattern):
-            return True
-    return False
+    """Return True if *path* (or its basename) matches a noisy file pattern."""
+    basename = path.rsplit("/", 1)[-1]
+    if basename in NOISY_BASENAMES or path.endswith(NOISY_SUFFIXES):
+        return True
+    if NOISY_GLOB_RE.match(path) is not None:
+        return True
+    return "/" in path and NOISY_GLOB_RE.match(basename) is not None
 
 
 # ── Review deduplication ────────────────────────────────────────────────────
@@ -62,31 +82,45 @@ def _dedupe_reviews(reviews: list[Review]) -> list[Review]:
     only the most recent one counts.  Comment counts from earlier
     reviews are summed into the kept review so nothing is lost.
     """
-    by_author: dict[str, list[Review]] = defaultdict(list)
+    latest: dict[str, Review] = {}
+    total_comments: dict[str, int] = {}
     for rev in reviews:
-        by_author[rev.author_login].append(rev)
-
-    deduped: list[Review] = []
-    for _login, author_reviews in by_author.items():
-        author_reviews.sort(key=lambda r: r.submitted_at)
-        latest = author_reviews[-1]
+        login = rev.author_login
         # Sum comment counts from all reviews by this author on this PR
-        total_comments = sum(r.comment_count for r in author_reviews)
-        deduped.append(Review(
-            author_login=latest.author_login,
-            state=latest.state,
-            submitted_at=latest.submitted_at,
-            comment_count=total_comments,
-        ))
-
-    return deduped
+        total_comments[login] = total_comments.get(login, 0) + rev.comment_count
+        prev = latest.get(login)
+        # ``>=`` so the last of equally-timestamped reviews wins
+        if prev is None or rev.submitted_at >= prev.submitted_at:
+            latest[login] = rev
+
+    return [
+        Review(
+            author_login=rev.author_login,
+            state=rev.state,
+            submitted_at=rev.submitted_at,
+            comment_count=total_comments[login],
+        )
+        for login, rev in latest.items()
+    ]
 
 
 # ── Parsing raw API data ───────────────────────────────────────────────────
 
-def parse_prs(raw_prs: list[dict], exclude_noisy: bool = True) -> list[PullRequest]:
+def _parse_ts(value: str | None, default: datetime) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp, or return *default* if missing.
+
+    ``fromisoformat`` accepts the trailing ``Z`` natively on Python 3.11+,
+    so no ``.replace("Z", "+00:00")`` copy is needed.
+    """
+    return datetime.fromisoformat(value) if value else default
+
+
+def parse_prs(raw_prs: Iterable[dict], exclude_noisy: bool = True) -> list[PullRequest]:
     """Convert raw GraphQL JSON dicts into ``PullRequest`` model objects.
 
+    *raw_prs* may be any iterable, e.g. ``storage.iter_raw_prs`` streaming
+    a JSONL dump, so raw dicts never need to be held in memory all at once.
+
     Reviews are deduped per (PR, reviewer) — only the latest review per
     reviewer counts, with comment counts summed across all their reviews.
 
@@ -94,23 +128,21 @@ def parse_prs(raw_prs: list[dict], exclude_noisy: bool = True) -> list[PullReque
     response — scoring never errors on absent fields.
     """
     result: list[PullRequest] = []
+    now = datetime.now(timezone.utc)
 
     for raw in raw_prs:
         author = raw.get("author") or {}
-        login = author.get("login", "ghost")
+        # Interned: logins repeat across thousands of PRs/reviews and are
+        # the grouping keys in score_engineers
+        login = sys.intern(author.get("login", "ghost"))
 
         raw_reviews: list[Review] = []
         for r in (raw.get("reviews", {}).get("nodes") or []):
             r_author = r.get("author") or {}
-            submitted = r.get("submittedAt")
             raw_reviews.append(Review(
-                author_login=r_author.get("login", "ghost"),
+                author_login=sys.intern(r_author.get("login", "ghost")),
                 state=r.get("state", ""),
-                submitted_at=(
-                    datetime.fromisoformat(submitted.replace("Z", "+00:00"))
-                    if submitted
-                    else datetime.now(timezone.utc)
-                ),
+                submitted_at=_parse_ts(r.get("submittedAt"), now),
                 comment_count=(r.get("comments") or {}).get("totalCount", 0),
             ))
 
@@ -126,25 +158,14 @@ def parse_prs(raw_prs: list[dict], exclude_noisy: bool = True) -> list[PullReque
                 deletions=f.get("deletions", 0),
             ))
 
-        merged_at_str = raw.get("mergedAt", "")
-        created_at_str = raw.get("createdAt", "")
-
         pr = PullRequest(
             node_id=raw.get("id", ""),
             number=raw.get("number", 0),
             title=raw.get("title", ""),
             url=raw.get("url", ""),
             author_login=login,
-            merged_at=(
-                datetime.fromisoformat(merged_at_str.replace("Z", "+00:00"))
-                if merged_at_str
-                else datetime.now(timezone.utc)
-            ),
-            created_at=(
-                datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-                if created_at_str
-                else datetime.now(timezone.utc)
-            ),
+            merged_at=_parse_ts(raw.get("mergedAt"), now),
+            created_at=_parse_ts(raw.get("createdAt"), now),
             changed_files_count=raw.get("changedFiles", 0),
             additions=raw.get("additions", 0),
             deletions=raw.get("deletions", 0),
@@ -158,6 +179,62 @@ def parse_prs(raw_prs: list[dict], exclude_noisy: bool = True) -> list[PullReque
     return result
 
 
+def _chunked(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _intern_logins(prs: list[PullRequest]) -> None:
+    """Re-intern logins on PRs unpickled from worker processes."""
+    for pr in prs:
+        pr.author_login = sys.intern(pr.author_login)
+        for rev in pr.reviews:
+            rev.author_login = sys.intern(rev.author_login)
+
+
+def parse_prs_parallel(
+    raw_prs: Iterable[dict],
+    exclude_noisy: bool = True,
+    max_workers: int | None = None,
+) -> list[PullRequest]:
+    """``parse_prs`` fanned out over a process pool for large dumps.
+
+    *raw_prs* is consumed lazily (e.g. straight from ``iter_raw_prs``) in
+    ``PARSE_CHUNK_SIZE`` chunks, with at most two chunks per worker in
+    flight, and results are concatenated in input order.  Falls back to a
+    plain streaming ``parse_prs`` at or below ``PARSE_PARALLEL_MIN_PRS``
+    PRs or when only one worker is available.
+    """
+    it = iter(raw_prs)
+    head = list(itertools.islice(it, PARSE_PARALLEL_MIN_PRS + 1))
+    workers = max_workers or os.cpu_count() or 1
+    if len(head) <= PARSE_PARALLEL_MIN_PRS or workers < 2:
+        return parse_prs(itertools.chain(head, it), exclude_noisy)
+
+    result: list[PullRequest] = []
+    pending: deque[Future[list[PullRequest]]] = deque()
+
+    def submit(chunk: list[dict]) -> None:
+        pending.append(pool.submit(parse_prs, chunk, exclude_noisy))
+        if len(pending) > 2 * workers:
+            result.extend(pending.popleft().result())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Hand out the buffered head first so it can be freed, then stream
+        for chunk in _chunked(head, PARSE_CHUNK_SIZE):
+            submit(chunk)
+        del head
+        for chunk in _chunked(it, PARSE_CHUNK_SIZE):
+            submit(chunk)
+        while pending:
+            result.extend(pending.popleft().result())
+
+    # Pickling back from workers loses parse_prs' interning
+    _intern_logins(result)
+    return result
+
+
 # ── Per-PR scoring helpers ──────────────────────────────────────────────────
 # Complexity ALWAYS uses PR-level totals (changed_files_count, additions +
 # deletions).  File lists from the API are often truncated for large PRs,
@@ -208,9 +285,10 @@ def _scaled_dir_churn(pr: PullRequest) -> dict[str, float]:
     if not pr.files:
         return {}
 
-    dir_churn_raw: dict[str, int] = defaultdict(int)
+    dir_churn_raw: dict[str, int] = {}
     for f in pr.files:
-        dir_churn_raw[f.directory] += f.churn
+        d = f.directory
+        dir_churn_raw[d] = dir_churn_raw.get(d, 0) + f.churn
 
     file_level_total = sum(dir_churn_raw.values())
     pr_level_total = pr.additions + pr.deletions
@@ -223,17 +301,135 @@ def _scaled_dir_churn(pr: PullRequest) -> dict[str, float]:
     return {d: churn * scale for d, churn in dir_churn_raw.items()}
 
 
-def compute_core_dirs(prs: list[PullRequest]) -> set[str]:
+def _scaled_log_churn_kernel(
+    file_start: np.ndarray,
+    file_dir: np.ndarray,
+    file_churn: np.ndarray,
+    pr_churn: np.ndarray,
+    n_dirs: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flat-array ``_scaled_dir_churn`` + ``log1p`` over every PR at once.
+
+    Files of PR ``p`` are ``file_start[p]:file_start[p + 1]``.  Returns
+    ``(pr_pos, dir_id, weight)`` triplets grouped by PR, directories in
+    first-touch order.  Plain loops so ``numba.njit`` can compile it.
+    """
+    n_files = file_dir.shape[0]
+    out_pr = np.empty(n_files, dtype=np.int64)
+    out_dir = np.empty(n_files, dtype=np.int64)
+    out_w = np.empty(n_files, dtype=np.float64)
+    acc = np.zeros(n_dirs, dtype=np.int64)
+    owner = np.full(n_dirs, -1, dtype=np.int64)
+    seen = np.empty(n_dirs, dtype=np.int64)
+    n_out = 0
+
+    for p in range(pr_churn.shape[0]):
+        n_seen = 0
+        file_total = 0
+        for f in range(file_start[p], file_start[p + 1]):
+            d = file_dir[f]
+            if owner[d] != p:
+                owner[d] = p
+                acc[d] = 0
+                seen[n_seen] = d
+                n_seen += 1
+            acc[d] += file_churn[f]
+            file_total += file_churn[f]
+        if file_total <= 0:
+            continue
+        scale = pr_churn[p] / file_total if pr_churn[p] > file_total else 1.0
+        for k in range(n_seen):
+            d = seen[k]
+            out_pr[n_out] = p
+            out_dir[n_out] = d
+            out_w[n_out] = math.log1p(acc[d] * scale)
+            n_out += 1
+
+    return out_pr[:n_out], out_dir[:n_out], out_w[:n_out]
+
+
+if _NUMBA_AVAILABLE:
+    _scaled_log_churn = numba.njit(cache=True)(_scaled_log_churn_kernel)
+
+
+@dataclass(slots=True)
+class DirTouches:
+    """Per-(PR, directory) touch weights as flat arrays.
+
+    ``weight[k] = log1p(scaled churn of dirs[dir_id[k]] in prs[pr_pos[k]])``,
+    grouped by PR in order.  Shared by ``compute_core_dirs`` and the
+    per-engineer core-touch ratio in ``score_engineers``.
+    """
+
+    pr_pos: np.ndarray
+    dir_id: np.ndarray
+    weight: np.ndarray
+    dirs: list[str]
+
+    @classmethod
+    def from_prs(cls, prs: list[PullRequest]) -> DirTouches:
+        dir_ids: dict[str, int] = {}
+        if not _NUMBA_AVAILABLE:
+            pr_pos: list[int] = []
+            dir_id: list[int] = []
+            weight: list[float] = []
+            for pos, pr in enumerate(prs):
+                for d, churn in _scaled_dir_churn(pr).items():
+                    pr_pos.append(pos)
+                    dir_id.append(dir_ids.setdefault(d, len(dir_ids)))
+                    weight.append(math.log1p(churn))
+            return cls(
+                pr_pos=np.array(pr_pos, dtype=np.int64),
+                dir_id=np.array(dir_id, dtype=np.int64),
+                weight=np.array(weight, dtype=np.float64),
+                dirs=list(dir_ids),
+            )
+
+        file_dir: list[int] = []
+        file_churn: list[int] = []
+        for pr in prs:
+            for f in pr.files:
+                file_dir.append(dir_ids.setdefault(f.directory, len(dir_ids)))
+                file_churn.append(f.churn)
+        file_start = np.zeros(len(prs) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((len(pr.files) for pr in prs), dtype=np.int64, count=len(prs)),
+            out=file_start[1:],
+        )
+        pr_pos, dir_id, weight = _scaled_log_churn(
+            file_start,
+            np.array(file_dir, dtype=np.int64),
+            np.array(file_churn, dtype=np.int64),
+            np.fromiter(
+                (pr.additions + pr.deletions for pr in prs),
+                dtype=np.int64,
+                count=len(prs),
+            ),
+            len(dir_ids),
+        )
+        return cls(pr_pos=pr_pos, dir_id=dir_id, weight=weight, dirs=list(dir_ids))
+
+
+def compute_core_dirs(
+    prs: list[PullRequest],
+    touches: DirTouches | None = None,
+) -> set[str]:
     """Identify the smallest set of top-level dirs covering 80% of activity.
 
     ``dir_score[d] = sum(log1p(scaled_churn_in_d_per_PR))`` over all PRs.
-    PRs with no file data are skipped.
+    PRs with no file data are skipped.  Pass *touches* to reuse weights
+    already built for *prs*.
     """
-    dir_score: dict[str, float] = defaultdict(float)
-
-    for pr in prs:
-        for d, churn in _scaled_dir_churn(pr).items():
-            dir_score[d] += math.log1p(churn)
+    if touches is None:
+        touches = DirTouches.from_prs(prs)
+    scores = np.bincount(
+        touches.dir_id, weights=touches.weight, minlength=len(touches.dirs)
+    ).tolist()
+    # Directories in first-touch order, so score ties break as before
+    touched, first = np.unique(touches.dir_id, return_index=True)
+    dir_score = {
+        touches.dirs[d]: scores[d] for d in touched[np.argsort(first)].tolist()
+    }
 
     if not dir_score:
         return set()
@@ -255,50 +451,72 @@ def compute_core_dirs(prs: list[PullRequest]) -> set[str]:
     return core
 
 
-def engineer_core_touch_ratio(
-    authored_prs: list[PullRequest],
-    core_dirs: set[str],
-) -> float:
-    """Ratio of core-weighted touches to total-weighted touches.
+# ── Vectorized per-PR aggregates ───────────────────────────────────────────
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# Multiplier packing (login id, YYYYWW week key) into one int64
+_WEEK_KEY_SPAN = 1_000_000
 
-    Uses scaled directory churn (matching PR-level totals).
-    PRs with no file data are skipped.
-    Returns 0.0 if total weighted touches < ``MIN_WEIGHTED_TOUCHES``.
-    """
-    total_wt = 0.0
-    core_wt = 0.0
 
-    for pr in authored_prs:
-        for d, churn in _scaled_dir_churn(pr).items():
-            w = math.log1p(churn)
-            total_wt += w
-            if d in core_dirs:
-                core_wt += w
+def _epoch_us(ts: datetime) -> int:
+    """Exact microseconds since the Unix epoch (no float rounding)."""
+    return (ts - _EPOCH) // _MICROSECOND
 
-    if total_wt < MIN_WEIGHTED_TOUCHES:
-        return 0.0
-    return core_wt / total_wt
 
+@dataclass(slots=True)
+class PRTable:
+    """Column-oriented view of a PR list: row ``i`` describes ``prs[i]``.
 
-# ── Consistency ─────────────────────────────────────────────────────────────
+    ``author_ids`` index into the login table passed to ``from_prs``.
+    """
+
+    changed_files: np.ndarray
+    churn: np.ndarray
+    discussion_total: np.ndarray
+    author_ids: np.ndarray
+    merged_us: np.ndarray  # merged_at as microseconds since the epoch
+    merged_week: np.ndarray  # ISO week as YYYY * 100 + WW
+
+    @classmethod
+    def from_prs(cls, prs: list[PullRequest], login_idx: dict[str, int]) -> PRTable:
+        n = len(prs)
+
+        def column(values: Iterable[int]) -> np.ndarray:
+            return np.fromiter(values, dtype=np.int64, count=n)
+
+        return cls(
+            changed_files=column(pr.changed_files_count for pr in prs),
+            churn=column(pr.additions + pr.deletions for pr in prs),
+            discussion_total=column(
+                pr.comments_total + pr.review_threads_total for pr in prs
+            ),
+            author_ids=column(login_idx[pr.author_login] for pr in prs),
+            merged_us=column(_epoch_us(pr.merged_at) for pr in prs),
+            merged_week=column(pr.week_key for pr in prs),
+        )
 
-def compute_active_weeks(
-    authored_prs: list[PullRequest],
-    reviewed: list[tuple[PullRequest, Review]],
-) -> int:
-    """Count distinct ISO weeks with a merged PR or submitted review."""
-    weeks: set[str] = set()
-    cutoff = datetime.now(timezone.utc) - timedelta(weeks=CONSISTENCY_WEEKS)
 
-    for pr in authored_prs:
-        if pr.merged_at >= cutoff:
-            weeks.add(pr.merged_at.strftime("%G-%V"))
+def pr_score_arrays(table: PRTable) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(complexity, discussion, shipping)`` arrays aligned with *table*.
 
-    for _pr, rev in reviewed:
-        if rev.submitted_at >= cutoff:
-            weeks.add(rev.submitted_at.strftime("%G-%V"))
+    Same formulas as ``pr_complexity`` / ``pr_discussion`` / ``pr_shipping``,
+    evaluated with one ``np.log1p`` pass per column instead of per PR.
+    """
+    complexity = np.log1p(table.changed_files) + COMPLEXITY_CHURN_COEFF * np.log1p(
+        table.churn
+    )
+    discussion = DISCUSSION_COEFF * np.log1p(table.discussion_total)
+    return complexity, discussion, complexity + discussion
 
-    return len(weeks)
+
+def review_points_array(
+    complexity: np.ndarray,
+    pr_pos: np.ndarray,
+    comment_counts: np.ndarray,
+) -> np.ndarray:
+    """Vectorized ``review_points``: one entry per (PR position, comment count)."""
+    return complexity[pr_pos] * (1 + REVIEW_COMMENT_COEFF * np.log1p(comment_counts))
 
 
 # ── Main scoring pipeline ──────────────────────────────────────────────────
@@ -318,54 +536,124 @@ def score_engineers(prs: list[PullRequest]) -> list[EngineerScore]:
             if rev.author_login != pr.author_login:
                 reviews_by_reviewer[rev.author_login].append((pr, rev))
 
-    all_engineers = set(prs_by_author.keys()) | set(reviews_by_reviewer.keys())
-    core_dirs = compute_core_dirs(prs)
+    touches = DirTouches.from_prs(prs)
+    core_dirs = compute_core_dirs(prs, touches)
+
+    # Dense login ids: authors in first-PR order, then review-only engineers
+    login_idx = {login: i for i, login in enumerate(prs_by_author)}
+    for login in reviews_by_reviewer:
+        if login not in login_idx:
+            login_idx[login] = len(login_idx)
+    logins = list(login_idx)
+    table = PRTable.from_prs(prs, login_idx)
+
+    # Per-PR scores computed once, looked up by id(pr) below
+    pos_by_pr = {id(pr): pos for pos, pr in enumerate(prs)}
+    complexity, discussion, shipping = pr_score_arrays(table)
+    pr_complexities = complexity.tolist()
+    pr_discussions = discussion.tolist()
+    pr_shippings = shipping.tolist()
+
+    shipping_totals = np.bincount(
+        table.author_ids, weights=shipping, minlength=len(logins)
+    )
+
+    # Core / total directory touch weights per author
+    touch_authors = table.author_ids[touches.pr_pos]
+    is_core = np.fromiter(
+        (d in core_dirs for d in touches.dirs), dtype=bool, count=len(touches.dirs)
+    )
+    total_wt = np.bincount(
+        touch_authors, weights=touches.weight, minlength=len(logins)
+    ).tolist()
+    core_wt = np.bincount(
+        touch_authors,
+        weights=np.where(is_core[touches.dir_id], touches.weight, 0.0),
+        minlength=len(logins),
+    ).tolist()
+
+    # Flattened review columns, one row per non-self review
+    rev_login: list[int] = []
+    rev_pr_pos: list[int] = []
+    rev_comments: list[int] = []
+    rev_us: list[int] = []
+    rev_week: list[int] = []
+    for pos, pr in enumerate(prs):
+        for rev in pr.reviews:
+            if rev.author_login == pr.author_login:
+                continue
+            rev_login.append(login_idx[rev.author_login])
+            rev_pr_pos.append(pos)
+            rev_comments.append(rev.comment_count)
+            rev_us.append(_epoch_us(rev.submitted_at))
+            rev_week.append(rev.week_key)
+    rev_ids = np.array(rev_login, dtype=np.int64)
+
+    review_totals = np.bincount(
+        rev_ids,
+        weights=review_points_array(
+            complexity,
+            np.array(rev_pr_pos, dtype=np.intp),
+            np.array(rev_comments, dtype=np.float64),
+        ),
+        minlength=len(logins),
+    )
+
+    # Active weeks: distinct (login, week) pairs inside the window
+    cutoff_us = _epoch_us(datetime.now(timezone.utc) - timedelta(weeks=CONSISTENCY_WEEKS))
+    pr_recent = table.merged_us >= cutoff_us
+    rev_recent = np.array(rev_us, dtype=np.int64) >= cutoff_us
+    login_weeks = np.unique(np.concatenate((
+        table.author_ids[pr_recent] * _WEEK_KEY_SPAN + table.merged_week[pr_recent],
+        rev_ids[rev_recent] * _WEEK_KEY_SPAN
+        + np.array(rev_week, dtype=np.int64)[rev_recent],
+    )))
+    active_weeks = np.bincount(login_weeks // _WEEK_KEY_SPAN, minlength=len(logins))
 
     results: list[EngineerScore] = []
 
-    for login in all_engineers:
+    # Exclude engineers with no shipping contribution
+    for i in np.flatnonzero(shipping_totals > 0).tolist():
+        login = logins[i]
         authored = prs_by_author.get(login, [])
         reviewed = reviews_by_reviewer.get(login, [])
 
         # A) BaseImpact
-        total_shipping = sum(pr_shipping(pr) for pr in authored)
-        if total_shipping <= 0:
-            # Exclude engineers with no shipping contribution
-            continue
-        total_review_pts = sum(
-            review_points(pr, rev.comment_count) for pr, rev in reviewed
-        )
+        total_shipping = float(shipping_totals[i])
+        total_review_pts = float(review_totals[i])
         base_impact = (
             SHIPPING_WEIGHT * total_shipping + REVIEW_WEIGHT * total_review_pts
         )
 
-        # B) CoreMultiplier
-        ctr = engineer_core_touch_ratio(authored, core_dirs)
+        # B) CoreMultiplier: core-weighted share of the engineer's touches
+        ctr = core_wt[i] / total_wt[i] if total_wt[i] >= MIN_WEIGHTED_TOUCHES else 0.0
         core_mult = 1 + CORE_MULTIPLIER_BOOST * ctr
 
         # C) ConsistencyBonus
-        active_wks = compute_active_weeks(authored, reviewed)
+        active_wks = int(active_weeks[i])
         consistency = 1 + CONSISTENCY_BOOST * (active_wks / CONSISTENCY_WEEKS)
 
         # FinalImpact
         final = base_impact * core_mult * consistency
 
-        # Top 3 PRs by shipping score
-        authored_scored = sorted(
-            [
-                {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "url": pr.url,
-                    "pr_shipping": round(pr_shipping(pr), 2),
-                    "complexity": round(pr_complexity(pr), 2),
-                    "discussion": round(pr_discussion(pr), 2),
-                }
-                for pr in authored
-            ],
-            key=lambda x: x["pr_shipping"],
-            reverse=True,
+        # Top 3 PRs by (rounded) shipping score; nlargest keeps the same
+        # tie order as a stable descending sort.
+        top_positions = heapq.nlargest(
+            3,
+            (pos_by_pr[id(pr)] for pr in authored),
+            key=lambda pos: round(pr_shippings[pos], 2),
         )
+        top_prs = [
+            {
+                "number": prs[pos].number,
+                "title": prs[pos].title,
+                "url": prs[pos].url,
+                "pr_shipping": round(pr_shippings[pos], 2),
+                "complexity": round(pr_complexities[pos], 2),
+                "discussion": round(pr_discussions[pos], 2),
+            }
+            for pos in top_positions
+        ]
 
         results.append(EngineerScore(
             login=login,
@@ -379,7 +667,7 @@ def score_engineers(prs: list[PullRequest]) -> list[EngineerScore]:
             consistency_bonus=round(consistency, 3),
             pr_count=len(authored),
             review_count=len(reviewed),
-            top_prs=authored_scored[:3],
+            top_prs=top_prs,
         ))
 
     results.sort(key=lambda s: s.final_impact, reverse=True)
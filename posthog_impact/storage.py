@@ -0,0 +1,57 @@
+"""Reading raw PR dumps written by the fetcher, plus derived on-disk caches."""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def latest_raw_file(raw_dir: Path) -> Path | None:
+    """Return the most recent raw PR dump (``prs_*.jsonl`` or legacy ``prs_*.json``)."""
+    return max(
+        (p for p in raw_dir.glob("prs_*") if p.suffix in (".json", ".jsonl")),
+        default=None,
+    )
+
+
+def iter_raw_prs(path: Path) -> Iterator[dict]:
+    """Yield raw PR dicts from a dump file.
+
+    JSONL files (one PR per line, as written by ``fetch_all_async``) are
+    read line by line; legacy ``.json`` files hold a single JSON array.
+    """
+    if path.suffix == ".jsonl":
+        with path.open("rb") as fh:
+            for line in fh:
+                if line.strip():
+                    yield orjson.loads(line)
+    else:
+        yield from orjson.loads(path.read_bytes())
+
+
+def raw_file_key(path: Path) -> str:
+    """Short blake2b content hash of a raw dump, used to key derived caches."""
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, lambda: hashlib.blake2b(digest_size=8)).hexdigest()
+
+
+def load_pickle(path: Path) -> Any | None:
+    """Return the unpickled contents of *path*, or ``None`` if unavailable."""
+    try:
+        with path.open("rb") as fh:
+            return pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError):
+        return None
+
+
+def dump_pickle(path: Path, obj: Any) -> None:
+    """Pickle *obj* to *path* via a ``.partial`` file, then rename into place."""
+    tmp_path = path.with_name(path.name + ".partial")
+    with tmp_path.open("wb") as fh:
+        pickle.dump(obj, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
-from posthog_impact.config import PROCESSED_DIR, RAW_DIR
-from posthog_impact.scoring import parse_prs, score_engineers
+import orjson
+
+from posthog_impact import models, scoring
+from posthog_impact.config import NOISY_FILE_PATTERNS, PROCESSED_DIR, RAW_DIR
+from posthog_impact.models import EngineerScore, PullRequest
+from posthog_impact.scoring import parse_prs_parallel, score_engineers
+from posthog_impact.storage import (
+    dump_pickle,
+    iter_raw_prs,
+    latest_raw_file,
+    load_pickle,
+    raw_file_key,
+)
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
@@ -16,29 +27,96 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _latest_raw_file() -> Path | None:
-    """Return the most recent raw PR dump file."""
-    files = sorted(RAW_DIR.glob("prs_*.json"))
-    return files[-1] if files else None
+def _serialize(scores: list[EngineerScore]) -> list[dict]:
+    """Convert scores to JSON-ready dicts."""
+    return [
+        {
+            "login": s.login,
+            "final_impact": s.final_impact,
+            "total_shipping": s.total_shipping,
+            "total_reviews": s.total_reviews,
+            "base_impact": s.base_impact,
+            "core_touch_ratio": s.core_touch_ratio,
+            "core_multiplier": s.core_multiplier,
+            "active_weeks": s.active_weeks,
+            "consistency_bonus": s.consistency_bonus,
+            "pr_count": s.pr_count,
+            "review_count": s.review_count,
+            "top_prs": s.top_prs,
+        }
+        for s in scores
+    ]
+
+
+def _parser_fingerprint() -> str:
+    """Hash of everything besides the raw dump that shapes parsed PRs.
+
+    Covers the noisy-file patterns and the model and parser sources, so
+    editing either invalidates cached parses without a manual version bump.
+    """
+    h = hashlib.blake2b(repr(NOISY_FILE_PATTERNS).encode(), digest_size=8)
+    for module in (models, scoring):
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _parsed_prs(
+    cache_dir: Path,
+    raw_file: Path,
+    raw_key: str,
+    exclude_noisy: bool,
+) -> list[PullRequest]:
+    """Parsed PRs for one noisy-file variant, cached on disk.
+
+    The cache is keyed by the raw dump's content hash plus
+    ``_parser_fingerprint``, so re-scoring an unchanged dump skips parsing.
+    After a fresh parse, caches for other keys are deleted.
+    """
+    variant = "clean" if exclude_noisy else "noisy"
+    key = f"parsed_{raw_key}_{_parser_fingerprint()}_"
+    cache_path = cache_dir / f"{key}{variant}.pkl"
+    prs = load_pickle(cache_path)
+    if prs is not None:
+        logger.info("Loaded parsed PRs from %s", cache_path)
+        # Unpickling loses parse_prs' interning
+        scoring._intern_logins(prs)
+        return prs
+
+    prs = parse_prs_parallel(iter_raw_prs(raw_file), exclude_noisy=exclude_noisy)
+    dump_pickle(cache_path, prs)
+    for stale in cache_dir.glob("parsed_*.pkl"):
+        if not stale.name.startswith(key):
+            logger.info("Removing stale parse cache %s", stale)
+            stale.unlink(missing_ok=True)
+    return prs
 
 
 def main() -> None:
-    """Load raw PRs, compute scores, and save to processed/."""
-    raw_file = _latest_raw_file()
+    """Load raw PRs, compute scores, and save to processed/.
+
+    Both noisy-file variants are scored so the dashboard toggle is a
+    lookup: ``scores`` excludes noisy files, ``scores_noisy`` keeps them.
+    """
+    raw_file = latest_raw_file(RAW_DIR)
     if raw_file is None:
         print("No raw data found. Run: python scripts/fetch.py")
         return
 
     logger.info("Loading raw data from %s", raw_file)
-    raw_prs = json.loads(raw_file.read_text())
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    raw_key = raw_file_key(raw_file)
 
-    prs = parse_prs(raw_prs, exclude_noisy=True)
+    # Each variant that misses the cache streams the dump from disk
+    prs = _parsed_prs(PROCESSED_DIR, raw_file, raw_key, exclude_noisy=True)
     logger.info("Parsed %d PRs", len(prs))
 
     scores = score_engineers(prs)
     logger.info("Scored %d engineers", len(scores))
 
-    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    noisy_prs = _parsed_prs(PROCESSED_DIR, raw_file, raw_key, exclude_noisy=False)
+    noisy_scores = score_engineers(noisy_prs)
+    logger.info("Scored %d engineers (noisy files included)", len(noisy_scores))
+
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
     out_path = PROCESSED_DIR / f"scores_{timestamp}.json"
 
@@ -49,26 +127,15 @@ def main() -> None:
             "pr_count": len(prs),
             "engineer_count": len(scores),
         },
-        "scores": [
-            {
-                "login": s.login,
-                "final_impact": s.final_impact,
-                "total_shipping": s.total_shipping,
-                "total_reviews": s.total_reviews,
-                "base_impact": s.base_impact,
-                "core_touch_ratio": s.core_touch_ratio,
-                "core_multiplier": s.core_multiplier,
-                "active_weeks": s.active_weeks,
-                "consistency_bonus": s.consistency_bonus,
-                "pr_count": s.pr_count,
-                "review_count": s.review_count,
-                "top_prs": s.top_prs,
-            }
-            for s in scores
-        ],
+        "scores": _serialize(scores),
+        "scores_noisy": _serialize(noisy_scores),
     }
 
-    out_path.write_text(json.dumps(serialized, indent=2))
+    out_path.write_bytes(
+        orjson.dumps(
+            serialized, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    )
     logger.info("Saved scores → %s", out_path)
 
     print(f"\nTop 10 engineers by FinalImpact (from {len(prs)} merged PRs):\n")
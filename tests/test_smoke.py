@@ -2,28 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import json
 import math
 import subprocess
 import sys
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
+import httpx
+import numpy as np
 import pytest
 
+from posthog_impact import github_client, scoring
+from posthog_impact.config import NOISY_FILE_PATTERNS
+from posthog_impact.fetcher import (
+    _search_query,
+    batched_pr_details_query,
+    iter_prs_with_files,
+    search_all_windows,
+    search_merged_pr_numbers,
+    search_windows,
+)
+from posthog_impact.github_client import NOT_MODIFIED, AsyncGitHubClient, GitHubClient
 from posthog_impact.models import EngineerScore, FileChange, PullRequest, Review
 from posthog_impact.scoring import (
+    DirTouches,
+    PRTable,
     _dedupe_reviews,
     _is_noisy,
     _scaled_dir_churn,
-    compute_active_weeks,
+    _scaled_log_churn_kernel,
     compute_core_dirs,
-    engineer_core_touch_ratio,
     parse_prs,
+    parse_prs_parallel,
     pr_complexity,
     pr_discussion,
     pr_shipping,
+    pr_score_arrays,
     review_points,
+    review_points_array,
     score_engineers,
 )
+from posthog_impact.storage import (
+    dump_pickle,
+    iter_raw_prs,
+    latest_raw_file,
+    load_pickle,
+    raw_file_key,
+)
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
@@ -86,7 +113,7 @@ def test_imports() -> None:
     """All package modules are importable."""
     from posthog_impact import __version__
     from posthog_impact.config import GRAPHQL_URL, PROJECT_ROOT, SHIPPING_WEIGHT
-    from posthog_impact.fetcher import fetch_all  # noqa: F401
+    from posthog_impact.fetcher import fetch_all_async  # noqa: F401
     from posthog_impact.github_client import GitHubClient  # noqa: F401
     from posthog_impact.models import EngineerScore, FileChange, PullRequest, Review  # noqa: F401
     from posthog_impact.scoring import score_engineers  # noqa: F401
@@ -111,6 +138,28 @@ def test_file_change_root_directory() -> None:
     assert fc.directory == "."
 
 
+def test_models_use_slots() -> None:
+    """Hot-loop models are slotted: no per-instance ``__dict__``."""
+    rev = Review("bob", "APPROVED", NOW)
+    pr = _make_pr(reviews=[rev])
+    for obj in (pr, rev, pr.files[0]):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unexpected = 1  # type: ignore[attr-defined]
+
+
+def test_iso_week_matches_strftime() -> None:
+    """Cached ``iso_week``/``week_key`` match ``%G-%V``, across year boundaries."""
+    for ts in (
+        datetime(2024, 12, 30, tzinfo=timezone.utc),  # ISO week 2025-01
+        datetime(2021, 1, 3, tzinfo=timezone.utc),    # ISO week 2020-53
+        NOW,
+    ):
+        for obj in (_make_pr(merged_at=ts), Review("bob", "APPROVED", ts)):
+            assert obj.iso_week == ts.strftime("%G-%V")
+            assert obj.week_key == int(ts.strftime("%G%V"))
+
+
 def test_pull_request_total_churn_from_files() -> None:
     pr = _make_pr(
         files=[FileChange("a.py", 30, 10), FileChange("b.py", 20, 5)],
@@ -166,6 +215,18 @@ def test_dedupe_reviews_single_review() -> None:
     assert deduped[0].author_login == "alice"
 
 
+def test_dedupe_reviews_out_of_order_and_ties() -> None:
+    """Latest wins regardless of input order; the last of equal timestamps wins."""
+    late = Review("bob", "APPROVED", NOW, comment_count=1)
+    early = Review("bob", "COMMENTED", NOW - timedelta(hours=1), comment_count=2)
+    tie = Review("bob", "CHANGES_REQUESTED", NOW, comment_count=0)
+
+    deduped = _dedupe_reviews([late, early, tie])
+    assert len(deduped) == 1
+    assert deduped[0].state == "CHANGES_REQUESTED"
+    assert deduped[0].comment_count == 3
+
+
 # ── Scoring formula tests ──────────────────────────────────────────────────
 
 
@@ -195,6 +256,26 @@ def test_review_points_with_comments() -> None:
     assert abs(review_points(pr, 10) - expected) < 0.001
 
 
+def test_vectorized_scores_match_scalar_formulas() -> None:
+    """NumPy per-PR and per-review scores equal the scalar helpers."""
+    prs = [
+        _make_pr(author="alice", changed_files_count=4, comments=3),
+        _make_pr(author="bob", additions=10, deletions=0, number=2),
+    ]
+    table = PRTable.from_prs(prs, {"alice": 0, "bob": 1})
+    complexity, discussion, shipping = pr_score_arrays(table)
+    assert table.author_ids.tolist() == [0, 1]
+
+    for pos, pr in enumerate(prs):
+        assert abs(complexity[pos] - pr_complexity(pr)) < 1e-9
+        assert abs(discussion[pos] - pr_discussion(pr)) < 1e-9
+        assert abs(shipping[pos] - pr_shipping(pr)) < 1e-9
+
+    points = review_points_array(complexity, np.array([1, 0]), np.array([0.0, 5.0]))
+    assert abs(points[0] - review_points(prs[1], 0)) < 1e-9
+    assert abs(points[1] - review_points(prs[0], 5)) < 1e-9
+
+
 # ── Core directory computation ──────────────────────────────────────────────
 
 
@@ -235,7 +316,6 @@ def test_core_dirs_computation() -> None:
 
 
 def test_core_touch_ratio() -> None:
-    core = {"frontend", "posthog"}
     prs = [
         _make_pr(
             files=[FileChange("frontend/x.ts", 100, 50)],
@@ -245,9 +325,53 @@ def test_core_touch_ratio() -> None:
             files=[FileChange("docs/y.md", 10, 5)],
             additions=15, deletions=0, changed_files_count=1, number=2,
         ),
+    ] + [
+        _make_pr(
+            author="bob",
+            files=[FileChange("frontend/z.ts", 100, 50)],
+            additions=150, deletions=0, changed_files_count=1, number=n,
+        )
+        for n in range(3, 6)
     ]
-    ratio = engineer_core_touch_ratio(prs, core)
-    assert 0 < ratio < 1
+    assert compute_core_dirs(prs) == {"frontend"}
+    alice = next(s for s in score_engineers(prs) if s.login == "alice")
+    assert 0 < alice.core_touch_ratio < 1
+
+
+def test_scaled_log_churn_kernel_matches_dict_path() -> None:
+    """The flat-array (numba) kernel yields the same triplets as the fallback."""
+    prs = [
+        _make_pr(
+            files=[
+                FileChange("frontend/a.ts", 10, 5),
+                FileChange("posthog/b.py", 3, 0),
+                FileChange("frontend/c.ts", 1, 1),
+            ],
+            additions=100, deletions=0, changed_files_count=3,
+        ),
+        _make_pr(files=[], number=2),
+        _make_pr(files=[FileChange("README.md", 0, 0)], number=3),
+        _make_pr(files=[FileChange("posthog/d.py", 40, 2)], number=4),
+    ]
+    touches = DirTouches.from_prs(prs)
+    dir_ids = {d: i for i, d in enumerate(touches.dirs)}
+
+    file_dir = [
+        dir_ids.setdefault(f.directory, len(dir_ids))
+        for pr in prs for f in pr.files
+    ]
+    file_start = np.cumsum([0] + [len(pr.files) for pr in prs])
+    pr_pos, dir_id, weight = _scaled_log_churn_kernel(
+        file_start,
+        np.array(file_dir),
+        np.array([f.churn for pr in prs for f in pr.files]),
+        np.array([pr.additions + pr.deletions for pr in prs]),
+        len(dir_ids),
+    )
+    assert pr_pos.tolist() == touches.pr_pos.tolist() == [0, 0, 3]
+    assert dir_id.tolist() == touches.dir_id.tolist()
+    assert weight.tolist() == touches.weight.tolist()
+    assert compute_core_dirs(prs, touches) == compute_core_dirs(prs)
 
 
 # ── Consistency ─────────────────────────────────────────────────────────────
@@ -262,14 +386,13 @@ def test_consistency_12_weeks() -> None:
         )
         for w in range(12)
     ]
-    active = compute_active_weeks(prs, [])
-    assert active == 12
+    [alice] = score_engineers(prs)
+    assert alice.active_weeks == 12
 
 
 def test_consistency_one_week() -> None:
-    prs = [_make_pr(author="alice", merged_at=NOW)]
-    active = compute_active_weeks(prs, [])
-    assert active == 1
+    [alice] = score_engineers([_make_pr(author="alice", merged_at=NOW)])
+    assert alice.active_weeks == 1
 
 
 # ── Noisy file filter ──────────────────────────────────────────────────────
@@ -284,6 +407,21 @@ def test_noisy_file_filter() -> None:
     assert _is_noisy("frontend/src/scenes/app.tsx") is False
 
 
+def test_noisy_fast_paths_match_fnmatch() -> None:
+    """Basename/suffix/glob buckets agree with plain per-pattern fnmatch."""
+    paths = [
+        "yarn.lock", "web/yarn.lock", "yarn.lock.bak", "a/b.generated.ts",
+        "x.min.js", "min.js", "dist/x.js", "src/dist/x.js", "build",
+        "api/__generated__/schema.ts", "assets/app.css.map", "README.md",
+    ]
+    for path in paths:
+        expected = any(
+            fnmatch.fnmatch(path, p) or fnmatch.fnmatch(path.split("/")[-1], p)
+            for p in NOISY_FILE_PATTERNS
+        )
+        assert _is_noisy(path) is expected, path
+
+
 # ── End-to-end scoring ─────────────────────────────────────────────────────
 
 
@@ -359,3 +497,364 @@ def test_missing_review_comment_count() -> None:
     # Scoring should not error
     scores = score_engineers(prs)
     assert len(scores) >= 1
+
+
+def test_parse_prs_parallel_preserves_order(monkeypatch) -> None:
+    """Chunked process-pool parsing of a generator keeps input order."""
+    monkeypatch.setattr(scoring, "PARSE_PARALLEL_MIN_PRS", 0)
+    monkeypatch.setattr(scoring, "PARSE_CHUNK_SIZE", 2)
+    raw = [
+        {
+            "number": n,
+            "author": {"login": f"user{n % 3}"},
+            "mergedAt": NOW.isoformat(),
+            "createdAt": NOW.isoformat(),
+            "_files": [{"path": "yarn.lock"}, {"path": "src/a.py", "additions": n}],
+        }
+        for n in range(5)
+    ]
+    prs = parse_prs_parallel(iter(raw), max_workers=2)
+    assert [pr.number for pr in prs] == list(range(5))
+    assert [[f.path for f in pr.files] for pr in prs] == [["src/a.py"]] * 5
+    # Logins unpickled from workers are re-interned in the parent
+    assert prs[0].author_login is sys.intern("user0")
+
+
+# ── Fetcher queries ────────────────────────────────────────────────────────
+
+
+def test_batched_pr_details_query_aliases() -> None:
+    """Each PR in a batch gets its own alias and number variable."""
+    query = batched_pr_details_query(3)
+    assert "$n2: Int!" in query
+    assert "pr2: pullRequest(number: $n2)" in query
+    assert query.count("...PRFields") == 3
+    assert "fragment PRFields on PullRequest" in query
+
+
+class _FakeBatchClient:
+    """Duck-typed async client answering batch-details and files queries."""
+
+    def __init__(self) -> None:
+        self.batches_started = 0
+
+    async def graphql(self, query: str, variables: dict) -> dict:
+        if "nodeId" in variables:
+            return {"node": {"files": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"path": f"src/{variables['nodeId']}.py"}],
+            }}}
+        self.batches_started += 1
+        numbers = [v for k, v in variables.items() if k[0] == "n" and k[1:].isdigit()]
+        # Later PRs answer faster, so completion order differs from input order
+        await asyncio.sleep(0.001 * (200 - numbers[0]) / 10)
+        return {"repository": {
+            f"pr{i}": {"id": f"P{n}", "number": n} for i, n in enumerate(numbers)
+        }}
+
+
+def test_iter_prs_with_files_bounded_and_ordered() -> None:
+    """Batches are scheduled lazily and PRs come out in input order."""
+    client = _FakeBatchClient()
+    numbers = list(range(100, 150))
+
+    async def collect() -> list[dict]:
+        out = []
+        async for pr in iter_prs_with_files(
+            client, "o", "r", numbers, batch_size=5, max_batches=2
+        ):
+            # Batches consumed so far + the bounded look-ahead window
+            assert client.batches_started <= len(out) // 5 + 1 + 2
+            out.append(pr)
+        return out
+
+    prs = asyncio.run(collect())
+    assert [pr["number"] for pr in prs] == numbers
+    assert prs[0]["_files"] == [{"path": "src/P100.py"}]
+
+
+def test_iter_prs_with_files_cancels_pending_on_close() -> None:
+    """Closing the iterator early cancels and awaits the look-ahead batches."""
+    async def first_then_close() -> set[asyncio.Task]:
+        prs = iter_prs_with_files(
+            _FakeBatchClient(), "o", "r", list(range(100, 150)),
+            batch_size=5, max_batches=3,
+        )
+        async for _pr in prs:
+            break
+        await prs.aclose()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(first_then_close()) == set()
+
+
+def test_search_windows_align_to_iso_weeks() -> None:
+    """Interior windows are Monday..Sunday; only the edges are partial."""
+    windows = search_windows(date(2026, 1, 7), date(2026, 1, 20), 7)
+    assert windows == [
+        (date(2026, 1, 7), date(2026, 1, 11)),
+        (date(2026, 1, 12), date(2026, 1, 18)),
+        (date(2026, 1, 19), date(2026, 1, 20)),
+    ]
+    # A later start keeps the interior week identical
+    assert (date(2026, 1, 12), date(2026, 1, 18)) in search_windows(
+        date(2026, 1, 9), date(2026, 1, 21), 7
+    )
+
+
+def test_search_all_windows_reuses_etags_and_prunes(tmp_path) -> None:
+    """Second run answers every window with a 304 and returns cached numbers."""
+    statuses: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        q = request.url.params["q"]
+        etag = f'"{abs(hash(q))}"'
+        if request.headers.get("If-None-Match") == etag:
+            statuses.append(304)
+            return httpx.Response(304, headers={"ETag": etag})
+        statuses.append(200)
+        number = int(q[-2:])  # day of the window's end date
+        return httpx.Response(
+            200,
+            json={"total_count": 1, "items": [{"number": number}]},
+            headers={"ETag": etag},
+        )
+
+    cache_path = tmp_path / "etags.json"
+    stale_q = "repo:o/r is:pr is:merged merged:2000-01-01..2000-01-02"
+    cache_path.write_text(json.dumps({stale_q: {}}))
+    since = datetime.now(timezone.utc) - timedelta(days=20)
+
+    async def run() -> list[int]:
+        client = AsyncGitHubClient(token="t", transport=httpx.MockTransport(handler))
+        async with client:
+            return await search_all_windows(
+                client, "o", "r", since, etag_cache_path=cache_path
+            )
+
+    first = asyncio.run(run())
+    assert statuses and set(statuses) == {200}
+    cached = json.loads(cache_path.read_text())
+    assert stale_q not in cached and len(cached) == len(statuses)
+
+    statuses.clear()
+    assert asyncio.run(run()) == first
+    assert set(statuses) == {304}
+
+
+def test_search_treats_partial_etag_entry_as_miss() -> None:
+    """Entries missing ``numbers`` or ``etag`` are refetched unconditionally."""
+    sent: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("If-None-Match"))
+        return httpx.Response(
+            200, json={"total_count": 1, "items": [{"number": 7}]}, headers={"ETag": '"new"'}
+        )
+
+    since, until = date(2026, 1, 12), date(2026, 1, 18)
+    q = _search_query("o", "r", since, until)
+
+    async def run(entry: dict) -> tuple[list[int], dict]:
+        cache = {q: entry}
+        client = AsyncGitHubClient(token="t", transport=httpx.MockTransport(handler))
+        async with client:
+            numbers = await search_merged_pr_numbers(client, "o", "r", since, until, cache)
+        return numbers, cache
+
+    for entry in ({"etag": '"old"'}, {"numbers": [1]}):
+        numbers, cache = asyncio.run(run(entry))
+        assert numbers == [7]
+        assert cache[q] == {"etag": '"new"', "numbers": [7]}
+    assert sent == [None, None]
+
+
+# ── GitHub client ──────────────────────────────────────────────────────────
+
+
+def test_client_retries_transport_errors(monkeypatch) -> None:
+    """Read timeouts are retried with backoff; exhaustion raises RuntimeError."""
+    monkeypatch.setattr(github_client, "RETRY_BACKOFF", 0)
+    calls = {"n": 0}
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] < github_client.RETRY_MAX:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    with GitHubClient(token="t", transport=httpx.MockTransport(flaky)) as client:
+        assert client.rest_get("/rate_limit") == {"ok": True}
+    assert calls["n"] == github_client.RETRY_MAX
+
+    def dead(request: httpx.Request) -> httpx.Response:
+        raise httpx.RemoteProtocolError("dropped", request=request)
+
+    with GitHubClient(token="t", transport=httpx.MockTransport(dead)) as client:
+        with pytest.raises(RuntimeError, match="retries exhausted"):
+            client.rest_get("/rate_limit")
+
+
+def test_graphql_reset_at_memo_reassigns_after_rest_headers() -> None:
+    """A repeated ``resetAt`` restores the parsed value REST headers overwrote."""
+    client = GitHubClient(token="t", transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    rate = {"cost": 1, "remaining": 4000, "resetAt": "2026-01-01T00:00:00Z"}
+    reset_at = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    client._update_rate_limit(rate)
+    assert client._reset_at == reset_at
+    client._track_rest_headers(httpx.Response(
+        200, headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1"}
+    ))
+    assert (client._remaining, client._reset_at) == (10, 1.0)
+    client._update_rate_limit(rate)
+    assert (client._remaining, client._reset_at) == (4000, reset_at)
+    client.close()
+
+
+def test_async_client_limits_concurrency() -> None:
+    """No more than ``max_concurrency`` requests are in flight at once."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run() -> list[dict]:
+        client = AsyncGitHubClient(
+            token="t", max_concurrency=2, transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            return await asyncio.gather(
+                *(client.rest_get(f"/repos/o/r/pulls/{n}") for n in range(6))
+            )
+
+    results = asyncio.run(run())
+    assert [r["path"] for r in results] == [f"/repos/o/r/pulls/{n}" for n in range(6)]
+    assert in_flight["peak"] == 2
+
+
+def test_async_client_retries_rate_limits(monkeypatch) -> None:
+    """HTTP 429 and GraphQL rate-limit errors are retried, then succeed."""
+    monkeypatch.setattr(github_client, "GRAPHQL_RATE_LIMIT_SLEEP", 0)
+    calls = {"rest": 0, "graphql": 0}
+    rate = {"cost": 1, "remaining": 4999, "resetAt": "2026-01-01T00:00:00Z"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url == github_client.GRAPHQL_URL:
+            calls["graphql"] += 1
+            if calls["graphql"] == 1:
+                return httpx.Response(
+                    200, json={"errors": [{"message": "API rate limit exceeded"}]}
+                )
+            return httpx.Response(200, json={"data": {"viewer": "t", "rateLimit": rate}})
+        calls["rest"] += 1
+        if calls["rest"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True}, headers={"X-RateLimit-Remaining": "42"})
+
+    async def run() -> tuple[dict, dict, int]:
+        client = AsyncGitHubClient(token="t", transport=httpx.MockTransport(handler))
+        async with client:
+            rest = await client.rest_get("/rate_limit")
+            remaining = client._remaining
+            data = await client.graphql("{ viewer rateLimit { cost } }")
+            return rest, data, remaining
+
+    rest, data, remaining = asyncio.run(run())
+    assert rest == {"ok": True} and remaining == 42
+    assert data["viewer"] == "t"
+    assert calls == {"rest": 2, "graphql": 2}
+
+
+def test_async_rest_get_conditional_not_modified() -> None:
+    """A matching ETag yields ``NOT_MODIFIED`` and keeps the cached ETag."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"items": []}, headers={"ETag": '"v1"'})
+
+    async def run() -> tuple[tuple, tuple]:
+        client = AsyncGitHubClient(token="t", transport=httpx.MockTransport(handler))
+        async with client:
+            fresh = await client.rest_get_conditional("/search/issues")
+            cached = await client.rest_get_conditional("/search/issues", etag=fresh[1])
+            return fresh, cached
+
+    fresh, cached = asyncio.run(run())
+    assert fresh == ({"items": []}, '"v1"')
+    assert cached[0] is NOT_MODIFIED and cached[1] == '"v1"'
+
+
+def test_iter_prs_with_files_over_async_client() -> None:
+    """Details and paginated files queries go through the real client."""
+    rate = {"cost": 1, "remaining": 4999, "resetAt": "2026-01-01T00:00:00Z"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        if "nodeId" in variables:
+            node_id, cursor = variables["nodeId"], variables["cursor"]
+            page = {
+                "pageInfo": {"hasNextPage": cursor is None, "endCursor": "c1"},
+                "nodes": [{"path": f"{node_id}/{cursor or 'c0'}.py"}],
+            }
+            return httpx.Response(
+                200, json={"data": {"node": {"files": page}, "rateLimit": rate}}
+            )
+        repo = {
+            k.replace("n", "pr"): {"id": f"P{v}", "number": v}
+            for k, v in variables.items()
+            if k[0] == "n" and k[1:].isdigit()
+        }
+        return httpx.Response(200, json={"data": {"repository": repo, "rateLimit": rate}})
+
+    async def collect() -> list[dict]:
+        client = AsyncGitHubClient(token="t", transport=httpx.MockTransport(handler))
+        async with client:
+            return [
+                pr async for pr in iter_prs_with_files(
+                    client, "o", "r", [3, 1, 2], batch_size=2, max_batches=1
+                )
+            ]
+
+    prs = asyncio.run(collect())
+    assert [pr["number"] for pr in prs] == [3, 1, 2]
+    assert prs[0]["_files"] == [{"path": "P3/c0.py"}, {"path": "P3/c1.py"}]
+
+
+# ── Raw dump storage ───────────────────────────────────────────────────────
+
+
+def test_iter_raw_prs_jsonl_and_legacy_json(tmp_path) -> None:
+    """JSONL dumps stream line by line; legacy JSON arrays still load."""
+    records = [{"number": 1}, {"number": 2}]
+    jsonl = tmp_path / "prs_20260102T000000.jsonl"
+    jsonl.write_text('{"number": 1}\n{"number": 2}\n')
+    legacy = tmp_path / "prs_20260101T000000.json"
+    legacy.write_text('[{"number": 1}, {"number": 2}]')
+
+    assert list(iter_raw_prs(jsonl)) == records
+    assert list(iter_raw_prs(legacy)) == records
+    assert latest_raw_file(tmp_path) == jsonl
+
+
+def test_parsed_pickle_cache_round_trip(tmp_path) -> None:
+    """Slotted models survive the parsed-PR pickle cache; bad files read as None."""
+    raw = tmp_path / "prs_1.jsonl"
+    raw.write_text('{"number": 1}\n')
+    key = raw_file_key(raw)
+    assert key == raw_file_key(raw) and len(key) == 16
+
+    prs = [_make_pr(reviews=[Review("bob", "APPROVED", NOW)])]
+    cache = tmp_path / f"parsed_{key}.pkl"
+    dump_pickle(cache, prs)
+    loaded_prs = load_pickle(cache)
+    assert loaded_prs == prs
+    assert loaded_prs[0].iso_week == prs[0].iso_week
+
+    cache.write_bytes(b"not a pickle")
+    assert load_pickle(cache) is None
+    assert load_pickle(tmp_path / "missing.pkl") is None